@@ -26,27 +26,30 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "RDF Fabric Converter Contributors"
 
-# Main exports from rdf package
-from .rdf import (
-    RDFToFabricConverter,
-    StreamingRDFConverter,
-    EntityType,
-    RelationshipType,
-    EntityTypeProperty,
-    RelationshipEnd,
-    parse_ttl_file,
-    parse_ttl_content,
-    parse_ttl_with_result,
-    convert_to_fabric_definition,
-    PreflightValidator,
-    FabricToTTLConverter,
-)
+from importlib import import_module
 
-from .core import (
-    FabricConfig,
-    FabricOntologyClient,
-    FabricAPIError,
-)
+# Export name -> subpackage providing it. The subpackages are imported on
+# first access, so entry points that never touch RDF (e.g. the workspace
+# CLI commands) do not pay for importing rdflib and the Fabric client.
+_LAZY_EXPORTS = {
+    # Main exports from rdf package
+    "RDFToFabricConverter": ".rdf",
+    "StreamingRDFConverter": ".rdf",
+    "EntityType": ".rdf",
+    "RelationshipType": ".rdf",
+    "EntityTypeProperty": ".rdf",
+    "RelationshipEnd": ".rdf",
+    "parse_ttl_file": ".rdf",
+    "parse_ttl_content": ".rdf",
+    "parse_ttl_with_result": ".rdf",
+    "convert_to_fabric_definition": ".rdf",
+    "PreflightValidator": ".rdf",
+    "FabricToTTLConverter": ".rdf",
+    # Client
+    "FabricConfig": ".core",
+    "FabricOntologyClient": ".core",
+    "FabricAPIError": ".core",
+}
 
 __all__ = [
     # RDF converter
@@ -69,3 +72,12 @@ __all__ = [
     "FabricOntologyClient",
     "FabricAPIError",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -11,6 +11,7 @@ This module provides a clean separation of concerns for the CLI:
 - format.py: Format enum and dispatch helpers
 """
 
+from . import commands as _commands
 from .commands import (
     # Base
     BaseCommand,
@@ -18,17 +19,6 @@ from .commands import (
     IConverter,
     IFabricClient,
     print_conversion_summary,
-    # Common
-    ListCommand,
-    GetCommand,
-    DeleteCommand,
-    TestCommand,
-    CompareCommand,
-    # Unified
-    ValidateCommand,
-    ConvertCommand,
-    UploadCommand,
-    ExportCommand,
 )
 
 from .parsers import create_argument_parser
@@ -68,3 +58,12 @@ __all__ = [
     # Format
     'Format',
 ]
+
+
+def __getattr__(name):
+    # Command classes are resolved lazily by the commands package
+    if name in _commands._LAZY_COMMANDS:
+        value = getattr(_commands, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,8 @@ This package contains split command modules for better organization:
 - common.py: Common commands (list, get, delete, test, compare)
 """
 
+from importlib import import_module
+
 from .base import (
     BaseCommand,
     IValidator,
@@ -19,21 +21,30 @@ from .base import (
     print_conversion_summary,
 )
 
-from .common import (
-    ListCommand,
-    GetCommand,
-    DeleteCommand,
-    TestCommand,
-    CompareCommand,
-)
+# Command class -> defining module. Commands are imported on first access so
+# that running one command does not import every other command module.
+_LAZY_COMMANDS = {
+    # Common
+    'ListCommand': '.common',
+    'GetCommand': '.common',
+    'DeleteCommand': '.common',
+    'TestCommand': '.common',
+    'CompareCommand': '.common',
+    # Unified (split modules)
+    'ValidateCommand': '.unified.validate',
+    'ConvertCommand': '.unified.convert',
+    'UploadCommand': '.unified.upload',
+    'ExportCommand': '.unified.export',
+}
 
-# Import from unified package (split modules)
-from .unified import (
-    ValidateCommand,
-    ConvertCommand,
-    UploadCommand,
-    ExportCommand,
-)
+
+def __getattr__(name):
+    module_name = _LAZY_COMMANDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
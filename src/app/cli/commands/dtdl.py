@@ -191,18 +191,16 @@ class DTDLConvertCommand(BaseCommand):
 
         print(f"Parsed {len(result.interfaces)} interfaces")
 
-        validator = DTDLValidator()
-        validation_result = validator.validate(result.interfaces)
+        converter = DTDLToFabricConverter(**_get_converter_kwargs(args))
+        conversion_result, validation_result = converter.convert_with_validation(
+            result.interfaces, DTDLValidator()
+        )
 
         if validation_result.errors:
             print(f"Validation errors: {len(validation_result.errors)}")
             for error in validation_result.errors[:5]:
                 print(f"  - {error.message}")
             return 1
-
-        converter = DTDLToFabricConverter(**_get_converter_kwargs(args))
-
-        conversion_result = converter.convert(result.interfaces)
         ontology_name = getattr(args, 'ontology_name', None) or path.stem
         definition = converter.to_fabric_definition(conversion_result, ontology_name)
 
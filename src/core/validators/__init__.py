@@ -43,6 +43,7 @@ from .fabric_schema import (
     FabricSchemaValidationError,
     SchemaValidationResult,
     validate_fabric_definition,
+    validate_fabric_definitions,
     validate_entity_type,
     validate_relationship_type,
 )
@@ -67,6 +68,7 @@ __all__ = [
     'FabricSchemaValidationError',
     'SchemaValidationResult',
     'validate_fabric_definition',
+    'validate_fabric_definitions',
     'validate_entity_type',
     'validate_relationship_type',
 ]
@@ -6,11 +6,23 @@ Validates ontology definitions against Microsoft Fabric API limits.
 
 import json
 import logging
+import operator
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Fetches the attributes EntityIdPartsInferrer.infer_all needs in one C-level call
+_entity_inference_attrs = operator.attrgetter('name', 'properties', 'entityIdParts')
+
+
+@lru_cache(maxsize=2048)
+def _lower(value: str) -> str:
+    """Lower-case a name; ontologies reuse a small vocabulary, so results are cached."""
+    return value.lower()
+
 
 @dataclass
 class FabricLimitValidationError:
@@ -404,6 +416,23 @@ class FabricLimitsValidator:
         return any(e.level == "error" for e in errors)
 
 
+@dataclass
+class _PropertyIndex:
+    """
+    Per-entity property attributes extracted once for entityIdParts inference.
+    
+    Attributes:
+        names_lower: Lower-cased property names, in declaration order
+        types: Property valueTypes, parallel to names_lower
+        ids: Property IDs, parallel to names_lower
+        id_by_name_lower: Lower-cased property name to property ID lookup
+    """
+    names_lower: List[str]
+    types: List[str]
+    ids: List[str]
+    id_by_name_lower: Dict[str, str]
+
+
 class EntityIdPartsInferrer:
     """
     Infers and sets entityIdParts for entity types.
@@ -463,25 +492,61 @@ class EntityIdPartsInferrer:
         
         self.valid_types = EntityIdPartsConfig.VALID_TYPES
         
+        # Lookup forms of the configuration above, built once for the per-property loops
+        self._patterns_lower = tuple(p.lower() for p in self.patterns)
+        self._patterns_lower_set = frozenset(self._patterns_lower)
+        # One compiled alternation finds any pattern as a substring in a single call
+        self._pattern_search = re.compile(
+            "|".join(re.escape(p) for p in self._patterns_lower)
+        ).search
+        self._valid_types = frozenset(self.valid_types)
+        
         self._logger = logging.getLogger(__name__)
     
-    def infer_entity_id_parts(self, entity: Any) -> List[str]:
+    def infer_entity_id_parts(
+        self,
+        entity: Any,
+        index: Optional["_PropertyIndex"] = None,
+    ) -> List[str]:
         """
         Infer entityIdParts for a single entity.
         
         Args:
             entity: EntityType object
+            index: Optional property index from index_properties, reused to avoid a rescan
             
         Returns:
             List of property IDs to use as entityIdParts
         """
-        entity_name = getattr(entity, 'name', '')
-        properties = getattr(entity, 'properties', [])
+        return self._infer_id_parts(
+            getattr(entity, 'name', ''),
+            getattr(entity, 'properties', []),
+            index,
+        )
+    
+    def _infer_id_parts(
+        self,
+        entity_name: str,
+        properties: List[Any],
+        index: Optional["_PropertyIndex"] = None,
+    ) -> List[str]:
+        """
+        Infer entityIdParts from an entity's already-fetched name and properties.
         
+        Args:
+            entity_name: Name of the entity type
+            properties: List of property objects
+            index: Optional property index for ``properties``; built if omitted
+            
+        Returns:
+            List of property IDs to use as entityIdParts
+        """
         # Check explicit mapping first
         if entity_name in self.explicit_mappings:
             explicit_props = self.explicit_mappings[entity_name]
-            return self._resolve_property_ids(properties, explicit_props)
+            if index is None:
+                index = self.index_properties(properties)
+            return self._resolve_property_ids(index, explicit_props)
         
         # Apply strategy
         if self.strategy == "none":
@@ -491,13 +556,47 @@ class EntityIdPartsInferrer:
             # Only use explicit mappings, return empty if not mapped
             return []
         
+        if index is None:
+            index = self.index_properties(properties)
+        
         if self.strategy == "first_valid":
-            return self._get_first_valid_property(properties)
+            return self._get_first_valid_property(index)
         
         # Default: "auto" strategy
-        return self._auto_infer(properties)
+        return self._auto_infer(index)
     
-    def _auto_infer(self, properties: List[Any]) -> List[str]:
+    def index_properties(self, properties: List[Any]) -> "_PropertyIndex":
+        """
+        Extract the property attributes used for inference in a single pass.
+        
+        Callers that run several inference steps on one entity (e.g.
+        infer_entity_id_parts() then set_display_name_property()) build the
+        index once and pass it to each step. The index is a snapshot; build a
+        new one after changing the entity's properties.
+        
+        Args:
+            properties: List of property objects
+            
+        Returns:
+            _PropertyIndex with parallel name/type/id lists and a name lookup
+        """
+        names_lower: List[str] = []
+        types: List[str] = []
+        ids: List[str] = []
+        id_by_name_lower: Dict[str, str] = {}
+        
+        for prop in properties:
+            name_lower = _lower(getattr(prop, 'name', ''))
+            prop_id = getattr(prop, 'id', '')
+            names_lower.append(name_lower)
+            types.append(getattr(prop, 'valueType', ''))
+            ids.append(prop_id)
+            # Keep the last occurrence, matching the previous dict-comprehension lookup
+            id_by_name_lower[name_lower] = prop_id
+        
+        return _PropertyIndex(names_lower, types, ids, id_by_name_lower)
+    
+    def _auto_infer(self, index: "_PropertyIndex") -> List[str]:
         """
         Automatically infer entityIdParts from properties.
         
@@ -506,59 +605,57 @@ class EntityIdPartsInferrer:
         2. First valid (String/BigInt) property
         
         Args:
-            properties: List of property objects
+            index: Property index built by index_properties
             
         Returns:
             List of property IDs
         """
+        pattern_search = self._pattern_search
+        patterns_lower_set = self._patterns_lower_set
+        valid_types = self._valid_types
+        names_lower = index.names_lower
+        ids = index.ids
+        
         # First, look for properties matching primary key patterns
-        for prop in properties:
-            prop_name = getattr(prop, 'name', '').lower()
-            prop_type = getattr(prop, 'valueType', '')
-            prop_id = getattr(prop, 'id', '')
-            
-            if prop_type not in self.valid_types:
+        for i, prop_type in enumerate(index.types):
+            if prop_type not in valid_types:
                 continue
             
-            # Check exact matches first
-            if prop_name in [p.lower() for p in self.patterns]:
-                return [prop_id]
+            prop_name = names_lower[i]
             
-            # Check contains patterns
-            for pattern in self.patterns:
-                if pattern.lower() in prop_name:
-                    return [prop_id]
+            # Exact match, then a substring match against any pattern
+            if prop_name in patterns_lower_set:
+                return [ids[i]]
+            if pattern_search(prop_name) is not None:
+                return [ids[i]]
         
         # Fall back to first valid property
-        return self._get_first_valid_property(properties)
+        return self._get_first_valid_property(index)
     
-    def _get_first_valid_property(self, properties: List[Any]) -> List[str]:
+    def _get_first_valid_property(self, index: "_PropertyIndex") -> List[str]:
         """Get the first property with a valid type for entityIdParts."""
-        for prop in properties:
-            prop_type = getattr(prop, 'valueType', '')
-            if prop_type in self.valid_types:
-                return [getattr(prop, 'id', '')]
+        valid_types = self._valid_types
+        for prop_type, prop_id in zip(index.types, index.ids):
+            if prop_type in valid_types:
+                return [prop_id]
         return []
     
-    def _resolve_property_ids(self, properties: List[Any], prop_names: List[str]) -> List[str]:
+    def _resolve_property_ids(self, index: "_PropertyIndex", prop_names: List[str]) -> List[str]:
         """
         Resolve property names to property IDs.
         
         Args:
-            properties: List of property objects
+            index: Property index built by index_properties
             prop_names: List of property names to find
             
         Returns:
             List of property IDs
         """
-        prop_by_name = {
-            getattr(p, 'name', '').lower(): getattr(p, 'id', '')
-            for p in properties
-        }
+        id_by_name_lower = index.id_by_name_lower
         
         result = []
         for name in prop_names:
-            prop_id = prop_by_name.get(name.lower())
+            prop_id = id_by_name_lower.get(_lower(name))
             if prop_id:
                 result.append(prop_id)
             else:
@@ -578,56 +675,69 @@ class EntityIdPartsInferrer:
             Number of entities updated
         """
         updated = 0
+        infer_id_parts = self._infer_id_parts
         
         for entity in entity_types:
-            current_parts = getattr(entity, 'entityIdParts', [])
+            try:
+                entity_name, properties, current_parts = _entity_inference_attrs(entity)
+            except AttributeError:
+                entity_name = getattr(entity, 'name', '')
+                properties = getattr(entity, 'properties', [])
+                current_parts = getattr(entity, 'entityIdParts', [])
             
             if current_parts and not overwrite:
                 continue
             
-            inferred_parts = self.infer_entity_id_parts(entity)
+            inferred_parts = infer_id_parts(entity_name, properties)
             
             if inferred_parts:
                 entity.entityIdParts = inferred_parts
                 updated += 1
                 
-                entity_name = getattr(entity, 'name', 'Unknown')
-                self._logger.debug(f"Set entityIdParts for '{entity_name}': {inferred_parts}")
+                self._logger.debug(
+                    f"Set entityIdParts for '{entity_name or 'Unknown'}': {inferred_parts}"
+                )
         
         return updated
     
-    def set_display_name_property(self, entity: Any) -> Optional[str]:
+    def set_display_name_property(
+        self,
+        entity: Any,
+        index: Optional["_PropertyIndex"] = None,
+    ) -> Optional[str]:
         """
         Set displayNamePropertyId based on entityIdParts or first string property.
         
         Args:
             entity: EntityType object
+            index: Optional property index from index_properties, reused to avoid a rescan
             
         Returns:
             The property ID set, or None if not set
         """
-        properties = getattr(entity, 'properties', [])
+        if index is None:
+            index = self.index_properties(getattr(entity, 'properties', []))
         entity_id_parts = getattr(entity, 'entityIdParts', [])
         
         # Use first entityIdPart if it's a String
         if entity_id_parts:
-            for prop in properties:
-                if getattr(prop, 'id', '') == entity_id_parts[0]:
-                    if getattr(prop, 'valueType', '') == 'String':
-                        entity.displayNamePropertyId = prop.id
-                        return prop.id
+            first_part = entity_id_parts[0]
+            for prop_type, prop_id in zip(index.types, index.ids):
+                if prop_id == first_part:
+                    if prop_type == 'String':
+                        entity.displayNamePropertyId = prop_id
+                        return prop_id
         
         # Look for 'name' property
-        for prop in properties:
-            prop_name = getattr(prop, 'name', '').lower()
-            if 'name' in prop_name and getattr(prop, 'valueType', '') == 'String':
-                entity.displayNamePropertyId = prop.id
-                return prop.id
+        for prop_name, prop_type, prop_id in zip(index.names_lower, index.types, index.ids):
+            if 'name' in prop_name and prop_type == 'String':
+                entity.displayNamePropertyId = prop_id
+                return prop_id
         
         # Fall back to first String property
-        for prop in properties:
-            if getattr(prop, 'valueType', '') == 'String':
-                entity.displayNamePropertyId = prop.id
-                return prop.id
+        for prop_type, prop_id in zip(index.types, index.ids):
+            if prop_type == 'String':
+                entity.displayNamePropertyId = prop_id
+                return prop_id
         
         return None
@@ -12,6 +12,7 @@ Usage:
     from core.validators.fabric_schema import (
         FabricSchemaValidator,
         validate_fabric_definition,
+        validate_fabric_definitions,
         validate_entity_type,
         validate_relationship_type,
     )
@@ -21,6 +22,9 @@ Usage:
     if errors:
         raise ValueError(f"Invalid definition: {errors}")
     
+    # Validate a batch of definitions
+    errors_per_definition = validate_fabric_definitions(definitions)
+    
     # Or use the validator class
     validator = FabricSchemaValidator()
     result = validator.validate(definition)
@@ -28,15 +32,33 @@ Usage:
         print(result.errors)
 """
 
-import base64
+import binascii
 import json
 import re
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+# orjson is optional; it parses payload bytes directly and is considerably faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# JSON parser for decoded payloads. Both accept str or UTF-8 bytes; invalid input
+# raises a ValueError subclass (json.JSONDecodeError, or UnicodeDecodeError).
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+@lru_cache(maxsize=2048)
+def _lower(value: str) -> str:
+    """Cached str.lower() for namespaces, which repeat across every part of a definition."""
+    return value.lower()
+
 
 # =============================================================================
 # Fabric API Constants (from API documentation)
@@ -80,11 +102,23 @@ FABRIC_NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
 # ID constraints (IDs should be numeric strings)
 FABRIC_ID_PATTERN = re.compile(r'^\d+$')
 
+# Bound matcher for the per-entity name check. IDs are checked with
+# str.isdecimal(), which tests the same digit class as FABRIC_ID_PATTERN
+# without building a match object.
+_match_fabric_name = FABRIC_NAME_PATTERN.match
+
 # Definition constraints
 FABRIC_MAX_ENTITY_TYPES = 500
 FABRIC_MAX_RELATIONSHIP_TYPES = 500
 FABRIC_MAX_PROPERTIES_PER_ENTITY = 200
 
+# Definition part kinds, classified once per part from its path
+_PART_ENTITY, _PART_REL, _PART_PLATFORM, _PART_DEF, _PART_OTHER = range(5)
+
+# Default for payload dict.get() lookups, so a single probe distinguishes an
+# absent key from one explicitly set to null
+_MISSING = object()
+
 
 # =============================================================================
 # Validation Result
@@ -93,14 +127,17 @@ FABRIC_MAX_PROPERTIES_PER_ENTITY = 200
 @dataclass
 class SchemaValidationResult:
     """Result of schema validation."""
-    is_valid: bool = True
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    @property
+    def is_valid(self) -> bool:
+        """True when no errors have been recorded."""
+        return not self.errors
+    
     def add_error(self, message: str) -> None:
         """Add a validation error."""
         self.errors.append(message)
-        self.is_valid = False
     
     def add_warning(self, message: str) -> None:
         """Add a validation warning."""
@@ -110,8 +147,6 @@ class SchemaValidationResult:
         """Merge another result into this one."""
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
-        if not other.is_valid:
-            self.is_valid = False
 
 
 class FabricSchemaValidationError(Exception):
@@ -146,6 +181,15 @@ class FabricSchemaValidator:
                 print(f"Error: {error}")
     """
     
+    # Required payload fields, in the order missing-field errors are reported
+    _ENTITY_REQUIRED_ORDER = ("id", "name", "namespace", "namespaceType", "visibility")
+    _REL_REQUIRED_ORDER = ("id", "name", "namespace", "namespaceType", "source", "target")
+    _PROPERTY_REQUIRED_ORDER = ("id", "name", "valueType")
+    
+    _ENTITY_REQUIRED = frozenset(_ENTITY_REQUIRED_ORDER)
+    _REL_REQUIRED = frozenset(_REL_REQUIRED_ORDER)
+    _PROPERTY_REQUIRED = frozenset(_PROPERTY_REQUIRED_ORDER)
+    
     def __init__(self, strict: bool = False):
         """
         Initialize the validator.
@@ -192,29 +236,34 @@ class FabricSchemaValidator:
         entity_count = 0
         relationship_count = 0
         
-        # Validate each part
+        # Decoded relationship payloads, checked against entity_ids once every
+        # entity part has been seen
+        relationships: List[Tuple[int, Dict[str, Any]]] = []
+        
+        # Validate each part in a single pass over the definition
         for i, part in enumerate(parts):
-            part_result = self._validate_part(part, i)
+            kind = self._classify_part(part)
+            part_result, payload_data = self._validate_part(part, i, kind)
             result.merge(part_result)
             
+            if kind == _PART_REL and isinstance(payload_data, dict):
+                relationships.append((i, payload_data))
+            
             # Extract and track IDs from valid parts
-            if part_result.is_valid and "payload" in part and "path" in part:
-                path = part["path"]
-                try:
-                    payload_data = self._decode_payload(part)
-                    if payload_data:
-                        if "EntityTypes" in path:
-                            entity_count += 1
-                            if "id" in payload_data:
-                                entity_ids.add(str(payload_data["id"]))
-                            if "name" in payload_data:
-                                entity_names.add(payload_data["name"])
-                        elif "RelationshipTypes" in path:
-                            relationship_count += 1
-                            if "id" in payload_data:
-                                relationship_ids.add(str(payload_data["id"]))
-                except Exception as e:
-                    result.add_error(f"Part {i}: Failed to decode payload: {e}")
+            if not part_result.errors and isinstance(payload_data, dict):
+                if kind == _PART_ENTITY:
+                    entity_count += 1
+                    entity_id = payload_data.get("id", _MISSING)
+                    if entity_id is not _MISSING:
+                        entity_ids.add(str(entity_id))
+                    entity_name = payload_data.get("name", _MISSING)
+                    if entity_name is not _MISSING:
+                        entity_names.add(entity_name)
+                elif kind == _PART_REL:
+                    relationship_count += 1
+                    rel_id = payload_data.get("id", _MISSING)
+                    if rel_id is not _MISSING:
+                        relationship_ids.add(str(rel_id))
         
         # Check limits
         if entity_count > FABRIC_MAX_ENTITY_TYPES:
@@ -228,42 +277,79 @@ class FabricSchemaValidator:
             )
         
         # Validate cross-references in relationships
-        for i, part in enumerate(parts):
-            if "RelationshipTypes" in part.get("path", ""):
-                try:
-                    payload_data = self._decode_payload(part)
-                    if payload_data:
-                        self._validate_relationship_references(
-                            payload_data, entity_ids, i, result
-                        )
-                except Exception:
-                    pass  # Already reported above
+        for i, rel_data in relationships:
+            self._validate_relationship_references(rel_data, entity_ids, i, result)
         
         # Convert warnings to errors in strict mode
-        if self.strict and result.warnings:
+        if self.strict:
             result.errors.extend(result.warnings)
-            result.warnings = []
-            result.is_valid = False
+            result.warnings.clear()
         
         return result
     
-    def _validate_part(self, part: Any, index: int) -> SchemaValidationResult:
-        """Validate a single definition part."""
+    def validate_many(
+        self, definitions: List[Dict[str, Any]]
+    ) -> List[SchemaValidationResult]:
+        """
+        Validate several ontology definitions with one validator instance.
+        
+        Args:
+            definitions: The ontology definitions to validate.
+            
+        Returns:
+            One SchemaValidationResult per definition, in input order.
+        """
+        validate = self.validate
+        return [validate(definition) for definition in definitions]
+    
+    @staticmethod
+    def _classify_part(part: Any) -> int:
+        """Classify a definition part by its path into one of the _PART_* kinds."""
+        path = part.get("path") if isinstance(part, dict) else None
+        if not isinstance(path, str):
+            return _PART_OTHER
+        if "EntityTypes" in path:
+            return _PART_ENTITY
+        if "RelationshipTypes" in path:
+            return _PART_REL
+        if path == ".platform":
+            return _PART_PLATFORM
+        if path == "definition.json":
+            return _PART_DEF
+        return _PART_OTHER
+    
+    def _validate_part(
+        self, part: Any, index: int, kind: int
+    ) -> Tuple[SchemaValidationResult, Optional[Any]]:
+        """
+        Validate a single definition part.
+        
+        Args:
+            part: The definition part to validate.
+            index: Position of the part, used in error messages.
+            kind: The part's _PART_* kind from _classify_part.
+        
+        Returns:
+            Tuple of (validation result, decoded JSON payload). The payload is
+            None when the part is malformed or its payload cannot be decoded.
+        """
         result = SchemaValidationResult()
+        add_error = result.add_error
+        add_warning = result.add_warning
         prefix = f"Part {index}"
         
         if not isinstance(part, dict):
-            result.add_error(f"{prefix}: Must be a dict, got {type(part).__name__}")
-            return result
+            add_error(f"{prefix}: Must be a dict, got {type(part).__name__}")
+            return result, None
         
         # Required fields
         required_fields = ["path", "payload", "payloadType"]
         for field in required_fields:
             if field not in part:
-                result.add_error(f"{prefix}: Missing required field '{field}'")
+                add_error(f"{prefix}: Missing required field '{field}'")
         
-        if not result.is_valid:
-            return result
+        if result.errors:
+            return result, None
         
         path = part["path"]
         payload = part["payload"]
@@ -271,199 +357,201 @@ class FabricSchemaValidator:
         
         # Validate path
         if not isinstance(path, str):
-            result.add_error(f"{prefix}: 'path' must be a string")
+            add_error(f"{prefix}: 'path' must be a string")
         
         # Validate payloadType
         if payload_type != "InlineBase64":
-            result.add_warning(
+            add_warning(
                 f"{prefix}: Unexpected payloadType '{payload_type}', expected 'InlineBase64'"
             )
         
         # Validate payload is base64
         if not isinstance(payload, str):
-            result.add_error(f"{prefix}: 'payload' must be a string")
-            return result
+            add_error(f"{prefix}: 'payload' must be a string")
+            return result, None
         
+        # binascii.a2b_base64 is the C routine behind base64.b64decode, called
+        # directly to skip the wrapper's per-call argument handling
         try:
-            decoded = base64.b64decode(payload)
-            decoded_str = decoded.decode('utf-8')
+            decoded = binascii.a2b_base64(payload)
         except Exception as e:
-            result.add_error(f"{prefix}: Invalid base64 payload: {e}")
-            return result
+            add_error(f"{prefix}: Invalid base64 payload: {e}")
+            return result, None
+        
+        # Parse the payload bytes once; each validator below works on the parsed data
+        data: Optional[Any] = None
+        json_error: Optional[ValueError] = None
+        try:
+            data = _json_loads(decoded)
+        except ValueError as e:
+            json_error = e
         
         # Validate payload content based on path
-        if "EntityTypes" in path:
-            result.merge(self._validate_entity_type_payload(decoded_str, prefix))
-        elif "RelationshipTypes" in path:
-            result.merge(self._validate_relationship_type_payload(decoded_str, prefix))
-        elif path == ".platform":
-            result.merge(self._validate_platform_payload(decoded_str, prefix))
-        elif path == "definition.json":
-            result.merge(self._validate_definition_json_payload(decoded_str, prefix))
+        if kind == _PART_ENTITY:
+            if json_error is not None:
+                add_error(f"{prefix}: Invalid JSON in payload: {json_error}")
+            else:
+                result.merge(self._validate_entity_type_data(data, prefix))
+        elif kind == _PART_REL:
+            if json_error is not None:
+                add_error(f"{prefix}: Invalid JSON in payload: {json_error}")
+            else:
+                result.merge(self._validate_relationship_type_data(data, prefix))
+        elif kind == _PART_PLATFORM:
+            if json_error is not None:
+                add_error(f"{prefix}: Invalid JSON in .platform payload: {json_error}")
+            else:
+                result.merge(self._validate_platform_data(data, prefix))
+        elif kind == _PART_DEF:
+            if json_error is not None:
+                add_error(f"{prefix}: Invalid JSON in definition.json: {json_error}")
+            else:
+                result.merge(self._validate_definition_json_data(data, prefix))
         
-        return result
+        return result, data
     
-    def _decode_payload(self, part: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Decode and parse a part's payload."""
-        try:
-            decoded = base64.b64decode(part["payload"]).decode('utf-8')
-            return json.loads(decoded)
-        except Exception:
-            return None
-    
-    def _validate_entity_type_payload(
-        self, payload_str: str, prefix: str
-    ) -> SchemaValidationResult:
-        """Validate an EntityType payload."""
+    def _validate_entity_type_data(self, data: Any, prefix: str) -> SchemaValidationResult:
+        """Validate a parsed EntityType payload."""
         result = SchemaValidationResult()
-        
-        try:
-            data = json.loads(payload_str)
-        except json.JSONDecodeError as e:
-            result.add_error(f"{prefix}: Invalid JSON in payload: {e}")
-            return result
+        add_error = result.add_error
+        add_warning = result.add_warning
         
         if not isinstance(data, dict):
-            result.add_error(f"{prefix}: EntityType payload must be a dict")
+            add_error(f"{prefix}: EntityType payload must be a dict")
             return result
         
-        # Required fields for EntityType
-        required = ["id", "name", "namespace", "namespaceType", "visibility"]
-        for field in required:
-            if field not in data:
-                result.add_error(f"{prefix}: EntityType missing required field '{field}'")
+        # Required fields for EntityType (one subset check in the common case)
+        if not self._ENTITY_REQUIRED.issubset(data.keys()):
+            for field in self._ENTITY_REQUIRED_ORDER:
+                if field not in data:
+                    add_error(f"{prefix}: EntityType missing required field '{field}'")
         
         # Validate ID format
-        if "id" in data:
-            entity_id = str(data["id"])
-            if not FABRIC_ID_PATTERN.match(entity_id):
-                result.add_warning(f"{prefix}: EntityType ID '{entity_id}' is not numeric")
+        entity_id = data.get("id", _MISSING)
+        if entity_id is not _MISSING:
+            entity_id = str(entity_id)
+            if not entity_id.isdecimal():
+                add_warning(f"{prefix}: EntityType ID '{entity_id}' is not numeric")
         
         # Validate name
-        if "name" in data:
-            name = data["name"]
+        name = data.get("name", _MISSING)
+        if name is not _MISSING:
             if len(name) > FABRIC_NAME_MAX_LENGTH:
-                result.add_error(
+                add_error(
                     f"{prefix}: EntityType name '{name[:50]}...' exceeds {FABRIC_NAME_MAX_LENGTH} chars"
                 )
-            if not FABRIC_NAME_PATTERN.match(name):
-                result.add_warning(
+            if not _match_fabric_name(name):
+                add_warning(
                     f"{prefix}: EntityType name '{name}' may not be valid "
                     "(should start with letter, contain only letters/numbers/underscores)"
                 )
         
         # Validate namespace
-        if "namespace" in data:
-            namespace = data["namespace"].lower()
+        namespace = data.get("namespace", _MISSING)
+        if namespace is not _MISSING:
+            namespace = _lower(namespace)
             if namespace in FABRIC_RESERVED_NAMESPACES:
-                result.add_error(f"{prefix}: Cannot use reserved namespace '{namespace}'")
+                add_error(f"{prefix}: Cannot use reserved namespace '{namespace}'")
         
         # Validate namespaceType
-        if "namespaceType" in data:
-            ns_type = data["namespaceType"]
-            if ns_type not in FABRIC_NAMESPACE_TYPES:
-                result.add_error(
-                    f"{prefix}: Invalid namespaceType '{ns_type}', must be one of {FABRIC_NAMESPACE_TYPES}"
-                )
+        ns_type = data.get("namespaceType", _MISSING)
+        if ns_type is not _MISSING and ns_type not in FABRIC_NAMESPACE_TYPES:
+            add_error(
+                f"{prefix}: Invalid namespaceType '{ns_type}', must be one of {FABRIC_NAMESPACE_TYPES}"
+            )
         
         # Validate visibility
-        if "visibility" in data:
-            visibility = data["visibility"]
-            if visibility not in FABRIC_VISIBILITY_VALUES:
-                result.add_error(
-                    f"{prefix}: Invalid visibility '{visibility}', must be one of {FABRIC_VISIBILITY_VALUES}"
-                )
+        visibility = data.get("visibility", _MISSING)
+        if visibility is not _MISSING and visibility not in FABRIC_VISIBILITY_VALUES:
+            add_error(
+                f"{prefix}: Invalid visibility '{visibility}', must be one of {FABRIC_VISIBILITY_VALUES}"
+            )
         
         # Validate properties
-        if "properties" in data:
-            properties = data["properties"]
+        properties = data.get("properties", _MISSING)
+        if properties is not _MISSING:
             if not isinstance(properties, list):
-                result.add_error(f"{prefix}: 'properties' must be a list")
+                add_error(f"{prefix}: 'properties' must be a list")
             elif len(properties) > FABRIC_MAX_PROPERTIES_PER_ENTITY:
-                result.add_error(
+                add_error(
                     f"{prefix}: Too many properties ({len(properties)}) exceeds limit of "
                     f"{FABRIC_MAX_PROPERTIES_PER_ENTITY}"
                 )
             else:
+                merge = result.merge
+                validate_property = self._validate_property
                 for j, prop in enumerate(properties):
-                    result.merge(self._validate_property(prop, f"{prefix}.properties[{j}]"))
+                    merge(validate_property(prop, f"{prefix}.properties[{j}]"))
         
         # Validate baseEntityTypeId if present
-        if "baseEntityTypeId" in data:
-            base_id = str(data["baseEntityTypeId"])
-            if not FABRIC_ID_PATTERN.match(base_id):
-                result.add_warning(f"{prefix}: baseEntityTypeId '{base_id}' is not numeric")
+        base_id = data.get("baseEntityTypeId", _MISSING)
+        if base_id is not _MISSING:
+            base_id = str(base_id)
+            if not base_id.isdecimal():
+                add_warning(f"{prefix}: baseEntityTypeId '{base_id}' is not numeric")
         
         return result
     
     def _validate_property(self, prop: Any, prefix: str) -> SchemaValidationResult:
         """Validate an EntityTypeProperty."""
         result = SchemaValidationResult()
+        add_error = result.add_error
         
         if not isinstance(prop, dict):
-            result.add_error(f"{prefix}: Property must be a dict")
+            add_error(f"{prefix}: Property must be a dict")
             return result
         
-        # Required fields
-        if "id" not in prop:
-            result.add_error(f"{prefix}: Property missing 'id'")
-        if "name" not in prop:
-            result.add_error(f"{prefix}: Property missing 'name'")
-        if "valueType" not in prop:
-            result.add_error(f"{prefix}: Property missing 'valueType'")
+        # Required fields (one subset check in the common case)
+        if not self._PROPERTY_REQUIRED.issubset(prop.keys()):
+            for field in self._PROPERTY_REQUIRED_ORDER:
+                if field not in prop:
+                    add_error(f"{prefix}: Property missing '{field}'")
         
         # Validate valueType
-        if "valueType" in prop:
-            value_type = prop["valueType"]
-            if value_type not in FABRIC_VALUE_TYPES:
-                result.add_error(
-                    f"{prefix}: Invalid valueType '{value_type}', must be one of {FABRIC_VALUE_TYPES}"
-                )
+        value_type = prop.get("valueType", _MISSING)
+        if value_type is not _MISSING and value_type not in FABRIC_VALUE_TYPES:
+            add_error(
+                f"{prefix}: Invalid valueType '{value_type}', must be one of {FABRIC_VALUE_TYPES}"
+            )
         
         # Validate name
-        if "name" in prop:
-            name = prop["name"]
-            if len(name) > FABRIC_NAME_MAX_LENGTH:
-                result.add_error(f"{prefix}: Property name too long")
+        name = prop.get("name", _MISSING)
+        if name is not _MISSING and len(name) > FABRIC_NAME_MAX_LENGTH:
+            add_error(f"{prefix}: Property name too long")
         
         return result
     
-    def _validate_relationship_type_payload(
-        self, payload_str: str, prefix: str
+    def _validate_relationship_type_data(
+        self, data: Any, prefix: str
     ) -> SchemaValidationResult:
-        """Validate a RelationshipType payload."""
+        """Validate a parsed RelationshipType payload."""
         result = SchemaValidationResult()
-        
-        try:
-            data = json.loads(payload_str)
-        except json.JSONDecodeError as e:
-            result.add_error(f"{prefix}: Invalid JSON in payload: {e}")
-            return result
+        add_error = result.add_error
         
         if not isinstance(data, dict):
-            result.add_error(f"{prefix}: RelationshipType payload must be a dict")
+            add_error(f"{prefix}: RelationshipType payload must be a dict")
             return result
         
-        # Required fields
-        required = ["id", "name", "namespace", "namespaceType", "source", "target"]
-        for field in required:
-            if field not in data:
-                result.add_error(f"{prefix}: RelationshipType missing required field '{field}'")
+        # Required fields (one subset check in the common case)
+        if not self._REL_REQUIRED.issubset(data.keys()):
+            for field in self._REL_REQUIRED_ORDER:
+                if field not in data:
+                    add_error(f"{prefix}: RelationshipType missing required field '{field}'")
         
         # Validate source and target
-        for endpoint in ["source", "target"]:
-            if endpoint in data:
-                ep_data = data[endpoint]
-                if not isinstance(ep_data, dict):
-                    result.add_error(f"{prefix}: '{endpoint}' must be a dict")
-                elif "entityTypeId" not in ep_data:
-                    result.add_error(f"{prefix}: '{endpoint}' missing 'entityTypeId'")
+        for endpoint in ("source", "target"):
+            ep_data = data.get(endpoint, _MISSING)
+            if ep_data is _MISSING:
+                continue
+            if not isinstance(ep_data, dict):
+                add_error(f"{prefix}: '{endpoint}' must be a dict")
+            elif "entityTypeId" not in ep_data:
+                add_error(f"{prefix}: '{endpoint}' missing 'entityTypeId'")
         
         # Validate name
-        if "name" in data:
-            name = data["name"]
-            if len(name) > FABRIC_NAME_MAX_LENGTH:
-                result.add_error(f"{prefix}: RelationshipType name too long")
+        name = data.get("name", _MISSING)
+        if name is not _MISSING and len(name) > FABRIC_NAME_MAX_LENGTH:
+            add_error(f"{prefix}: RelationshipType name too long")
         
         return result
     
@@ -486,18 +574,10 @@ class FabricSchemaValidator:
                         f"{endpoint} references unknown entityTypeId '{ep_id}'"
                     )
     
-    def _validate_platform_payload(
-        self, payload_str: str, prefix: str
-    ) -> SchemaValidationResult:
-        """Validate the .platform metadata payload."""
+    def _validate_platform_data(self, data: Any, prefix: str) -> SchemaValidationResult:
+        """Validate the parsed .platform metadata payload."""
         result = SchemaValidationResult()
         
-        try:
-            data = json.loads(payload_str)
-        except json.JSONDecodeError as e:
-            result.add_error(f"{prefix}: Invalid JSON in .platform payload: {e}")
-            return result
-        
         # .platform should have specific structure
         if "$schema" not in data:
             result.add_warning(f"{prefix}: .platform missing '$schema' field")
@@ -507,18 +587,10 @@ class FabricSchemaValidator:
         
         return result
     
-    def _validate_definition_json_payload(
-        self, payload_str: str, prefix: str
-    ) -> SchemaValidationResult:
-        """Validate the definition.json payload."""
+    def _validate_definition_json_data(self, data: Any, prefix: str) -> SchemaValidationResult:
+        """Validate the parsed definition.json payload."""
         result = SchemaValidationResult()
         
-        try:
-            data = json.loads(payload_str)
-        except json.JSONDecodeError as e:
-            result.add_error(f"{prefix}: Invalid JSON in definition.json: {e}")
-            return result
-        
         # definition.json should have metadata
         if "version" not in data:
             result.add_warning(f"{prefix}: definition.json missing 'version' field")
@@ -530,6 +602,11 @@ class FabricSchemaValidator:
 # Convenience Functions
 # =============================================================================
 
+# Shared non-strict validator for the single-payload helpers below; it holds no
+# per-call state, so one instance serves every call
+_DEFAULT_VALIDATOR = FabricSchemaValidator()
+
+
 def validate_fabric_definition(
     definition: Dict[str, Any],
     strict: bool = False,
@@ -558,6 +635,24 @@ def validate_fabric_definition(
     return result.errors
 
 
+def validate_fabric_definitions(
+    definitions: List[Dict[str, Any]],
+    strict: bool = False,
+) -> List[List[str]]:
+    """
+    Validate several ontology definitions against the Fabric API schema.
+    
+    Args:
+        definitions: The ontology definitions to validate.
+        strict: If True, treat warnings as errors.
+        
+    Returns:
+        List of validation errors for each definition, in input order.
+    """
+    validator = FabricSchemaValidator(strict=strict)
+    return [result.errors for result in validator.validate_many(definitions)]
+
+
 def validate_entity_type(entity_data: Dict[str, Any]) -> List[str]:
     """
     Validate a single EntityType dict.
@@ -568,9 +663,7 @@ def validate_entity_type(entity_data: Dict[str, Any]) -> List[str]:
     Returns:
         List of validation errors.
     """
-    validator = FabricSchemaValidator()
-    payload_str = json.dumps(entity_data)
-    result = validator._validate_entity_type_payload(payload_str, "EntityType")
+    result = _DEFAULT_VALIDATOR._validate_entity_type_data(entity_data, "EntityType")
     return result.errors
 
 
@@ -584,7 +677,5 @@ def validate_relationship_type(rel_data: Dict[str, Any]) -> List[str]:
     Returns:
         List of validation errors.
     """
-    validator = FabricSchemaValidator()
-    payload_str = json.dumps(rel_data)
-    result = validator._validate_relationship_type_payload(payload_str, "RelationshipType")
+    result = _DEFAULT_VALIDATOR._validate_relationship_type_data(rel_data, "RelationshipType")
     return result.errors
@@ -3,8 +3,9 @@
 import sys
 from importlib import import_module
 
-from formats import dtdl as _formats_dtdl
-from src.formats.dtdl import *  # type: ignore[F403]
+# Resolve the relocated package once; every export and bridged submodule
+# comes from this single module object instead of a second import path.
+_formats_dtdl = import_module("formats.dtdl")
 
 _BRIDGED_SUBMODULES = (
 	"dtdl_converter",
@@ -15,7 +16,15 @@ _BRIDGED_SUBMODULES = (
 )
 
 for _module_name in _BRIDGED_SUBMODULES:
-	_module = import_module(f"formats.dtdl.{_module_name}")
+	_module = import_module(f"{_formats_dtdl.__name__}.{_module_name}")
 	sys.modules[f"{__name__}.{_module_name}"] = _module
 
 __all__ = getattr(_formats_dtdl, "__all__", [])
+
+
+def __getattr__(name):
+	if name in __all__:
+		value = getattr(_formats_dtdl, name)
+		globals()[name] = value
+		return value
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,22 @@
 """Format pipelines for the Fabric ontology converter."""
 
-from .base import FormatPipeline
+import importlib
+from typing import Any
 
-__all__ = ["FormatPipeline"]
+# Format subpackages and FormatPipeline are resolved on first access so that
+# importing one format does not load the others (or the plugin layer that
+# ``base`` depends on).
+_SUBPACKAGES = frozenset({"cdm", "dtdl", "rdf"})
+
+__all__ = ["FormatPipeline", "cdm", "dtdl", "rdf"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "FormatPipeline":
+        value = importlib.import_module(".base", __name__).FormatPipeline
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, List, Optional
 
 from src.plugins.protocols import (
     ParserProtocol,
@@ -13,7 +13,27 @@ from src.plugins.protocols import (
 )
 
 
-@dataclass(slots=True)
+class _NullExporter:
+    """Exporter used by pipelines whose format has no export support."""
+
+    __slots__ = ()
+
+    def export(
+        self,
+        entity_types: List[Any],
+        relationship_types: List[Any],
+        **kwargs: Any,
+    ) -> None:
+        return None
+
+    def __repr__(self) -> str:
+        return "<no exporter>"
+
+
+_NULL_EXPORTER = _NullExporter()
+
+
+@dataclass(slots=True, frozen=True)
 class FormatPipeline:
     """Container describing the core services required to process a format."""
 
@@ -23,5 +43,11 @@ class FormatPipeline:
     converter: ConverterProtocol
     exporter: Optional[ExporterProtocol] = None
 
+    def __post_init__(self) -> None:
+        # Plugins report "no exporter" as None; store the shared null exporter
+        # instead so callers can always dispatch to ``exporter.export``.
+        if self.exporter is None:
+            object.__setattr__(self, "exporter", _NULL_EXPORTER)
+
     def has_exporter(self) -> bool:
-        return self.exporter is not None
+        return self.exporter is not _NULL_EXPORTER
@@ -23,90 +23,81 @@ Usage:
     result = converter.convert(interfaces)
 """
 
-from .dtdl_models import (
-    DTDLInterface,
-    DTDLProperty,
-    DTDLTelemetry,
-    DTDLRelationship,
-    DTDLComponent,
-    DTDLCommand,
-    DTDLCommandPayload,
-    DTDLEnum,
-    DTDLEnumValue,
-    DTDLObject,
-    DTDLArray,
-    DTDLMap,
-    DTDLContext,
-    DTDLScaledDecimal,
-    DTDLPrimitiveSchema,
-    GEOSPATIAL_SCHEMA_DTMIS,
-    SCALED_DECIMAL_SCHEMA_DTMI,
-)
+import importlib
+from typing import Any, List
 
-from .dtdl_parser import DTDLParser
-from .dtdl_validator import DTDLValidator, DTDLValidationError
-from .dtdl_converter import (
-    DTDLToFabricConverter,
-    DTDL_TO_FABRIC_TYPE,
-    ComponentMode,
-    CommandMode,
-    ScaledDecimalMode,
-    ScaledDecimalValue,
-)
-from .mode_converters import (
-    ComponentConverter,
-    CommandConverter,
-    ScaledDecimalConverter,
-)
-from .dtdl_type_mapper import (
-    DTDLTypeMapper,
-    TypeMappingResult,
-    FabricValueType,
-    PRIMITIVE_TYPE_MAP,
-    flatten_object_fields,
-    get_semantic_type_info,
-)
-
-__all__ = [
-    # Models
-    'DTDLInterface',
-    'DTDLProperty',
-    'DTDLTelemetry',
-    'DTDLRelationship',
-    'DTDLComponent',
-    'DTDLCommand',
-    'DTDLCommandPayload',
-    'DTDLEnum',
-    'DTDLEnumValue',
-    'DTDLObject',
-    'DTDLArray',
-    'DTDLMap',
-    'DTDLContext',
-    'DTDLScaledDecimal',
-    'DTDLPrimitiveSchema',
-    # DTDL v4 Schema DTMIs
-    'GEOSPATIAL_SCHEMA_DTMIS',
-    'SCALED_DECIMAL_SCHEMA_DTMI',
+# Defining submodule -> public names; the only list of exported names.
+# Submodules are imported on first attribute access (PEP 562), so e.g.
+# ``from formats.dtdl import DTDLParser`` does not pull in the converter.
+_EXPORTS = {
+    # Models and DTDL v4 schema DTMIs
+    '.dtdl_models': (
+        'DTDLInterface',
+        'DTDLProperty',
+        'DTDLTelemetry',
+        'DTDLRelationship',
+        'DTDLComponent',
+        'DTDLCommand',
+        'DTDLCommandPayload',
+        'DTDLEnum',
+        'DTDLEnumValue',
+        'DTDLObject',
+        'DTDLArray',
+        'DTDLMap',
+        'DTDLContext',
+        'DTDLScaledDecimal',
+        'DTDLPrimitiveSchema',
+        'GEOSPATIAL_SCHEMA_DTMIS',
+        'GEOSPATIAL_SCHEMA_DTMI_SET',
+        'SCALED_DECIMAL_SCHEMA_DTMI',
+    ),
     # Core classes
-    'DTDLParser',
-    'DTDLValidator',
-    'DTDLValidationError',
-    'DTDLToFabricConverter',
-    'DTDL_TO_FABRIC_TYPE',
-    # Converter mode enums
-    'ComponentMode',
-    'CommandMode',
-    'ScaledDecimalMode',
-    'ScaledDecimalValue',
+    '.dtdl_parser': ('DTDLParser',),
+    '.dtdl_validator': ('DTDLValidator', 'DTDLValidationError', 'is_valid_dtmi'),
+    '.dtdl_converter': (
+        'DTDLToFabricConverter',
+        'DTDL_TO_FABRIC_TYPE',
+        # Converter mode enums
+        'ComponentMode',
+        'CommandMode',
+        'ScaledDecimalMode',
+        'ScaledDecimalValue',
+    ),
     # Mode-specific converters
-    'ComponentConverter',
-    'CommandConverter',
-    'ScaledDecimalConverter',
+    '.mode_converters': (
+        'ComponentConverter',
+        'CommandConverter',
+        'ScaledDecimalConverter',
+    ),
     # Type Mapper
-    'DTDLTypeMapper',
-    'TypeMappingResult',
-    'FabricValueType',
-    'PRIMITIVE_TYPE_MAP',
-    'flatten_object_fields',
-    'get_semantic_type_info',
-]
+    '.dtdl_type_mapper': (
+        'DTDLTypeMapper',
+        'TypeMappingResult',
+        'FabricValueType',
+        'PRIMITIVE_TYPE_MAP',
+        'flatten_object_fields',
+        'get_semantic_type_info',
+    ),
+}
+
+_LAZY_IMPORTS = {
+    name: module_name
+    for module_name, names in _EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
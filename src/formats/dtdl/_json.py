@@ -0,0 +1,81 @@
+"""
+JSON shim for DTDL documents and Fabric definition parts.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. ``loads`` accepts ``str`` or UTF-8 ``bytes`` in both cases, so
+files can be read in binary mode and handed over without decoding first.
+The standard-library ``dumps`` functions leave non-ASCII characters
+unescaped, like orjson does. For the values the converter emits (dicts with
+str keys, lists, strings, bools, None, 64-bit ints and finite floats) both
+backends produce the same bytes. They differ outside that range: orjson
+rejects non-str keys and wider ints and writes NaN/Infinity as null, while
+the standard library stringifies keys and writes NaN/Infinity literally.
+"""
+
+import json
+import mmap
+import os
+from os import PathLike
+from typing import Any, Union
+
+# orjson is optional; install the ``fast`` extra to enable it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this one type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are memory-mapped and parsed in place when orjson
+# is available; below it a plain read is cheaper than setting up the mapping.
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+if ORJSON_AVAILABLE:
+    loads = orjson.loads
+    
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+    
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+else:
+    loads = json.loads
+    
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def load_file(path: Union[str, PathLike]) -> Any:
+    """
+    Read ``path`` as bytes and decode it as JSON.
+    
+    Large files are parsed straight from a read-only memory map when orjson
+    is in use, avoiding an intermediate copy of the file contents.
+    """
+    with open(path, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "JSONDecodeError",
+    "loads",
+    "dumps",
+    "dumps_bytes",
+    "load_file",
+]
@@ -13,14 +13,20 @@ Mapping Strategy:
 - DTDLScaledDecimal -> JSON, structured properties, or calculated value
 """
 
+import base64
 import hashlib
-import json
 import logging
+import re
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Any, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, Iterator, Mapping, Optional, Set, Tuple
 from pathlib import Path
 
+from . import _json
 from .dtdl_models import (
     DTDLInterface,
     DTDLProperty,
@@ -36,6 +42,8 @@ from .dtdl_models import (
     DTDLPrimitiveSchema,
     DTDLScaledDecimal,
 )
+from .dtdl_validator import DTDLValidator, ValidationResult
+from .mode_converters import sanitize_name
 
 # Import shared Fabric models
 from src.shared.models import (
@@ -61,8 +69,12 @@ from src.core.compliance import (
 logger = logging.getLogger(__name__)
 
 
-# Type mapping from DTDL to Fabric
-DTDL_TO_FABRIC_TYPE: Dict[str, str] = {
+# Type mapping from DTDL to Fabric.
+# Keys and values are identifier-like literals, which CPython interns, so the
+# value types returned by _schema_to_fabric_type are shared singletons and the
+# ==/!= checks on them (conflict detection, display-name selection)
+# short-circuit on identity. Keep them plain literals.
+_DTDL_FABRIC_TYPES: Dict[str, str] = {
     # Numeric types
     "boolean": "Boolean",
     "byte": "BigInt",
@@ -96,6 +108,79 @@ DTDL_TO_FABRIC_TYPE: Dict[str, str] = {
     "scaledDecimal": "String",
 }
 
+# Read-only public view; the converter looks types up through the dict directly
+DTDL_TO_FABRIC_TYPE: Mapping[str, str] = MappingProxyType(_DTDL_FABRIC_TYPES)
+_fabric_type_for = _DTDL_FABRIC_TYPES.get
+
+# String schema table for ScaledDecimalMode.CALCULATED, where the computed
+# scaledDecimal value is stored as a Double
+_CALCULATED_FABRIC_TYPES: Dict[str, str] = {**_DTDL_FABRIC_TYPES, "scaledDecimal": "Double"}
+
+def _enum_fabric_type(schema: DTDLEnum) -> str:
+    """Enums are stored as their value schema type."""
+    return _fabric_type_for(schema.value_schema, "String")
+
+
+def _string_fabric_type(schema: Any) -> str:
+    """Complex values stored as JSON strings."""
+    return "String"
+
+
+def _double_fabric_type(schema: Any) -> str:
+    """scaledDecimal values stored as their calculated Double."""
+    return "Double"
+
+
+# Complex schema class -> Fabric value type, dispatched on type(schema).
+# scaledDecimal is a JSON string except in CALCULATED mode.
+_COMPLEX_FABRIC_TYPES: Dict[type, Callable[[Any], str]] = {
+    DTDLEnum: _enum_fabric_type,
+    DTDLObject: _string_fabric_type,
+    DTDLArray: _string_fabric_type,
+    DTDLMap: _string_fabric_type,
+    DTDLScaledDecimal: _string_fabric_type,
+}
+_CALCULATED_COMPLEX_FABRIC_TYPES: Dict[type, Callable[[Any], str]] = {
+    **_COMPLEX_FABRIC_TYPES,
+    DTDLScaledDecimal: _double_fabric_type,
+}
+
+# DTDL version detection for compliance reports; anything else is v2
+_CONTEXT_VERSION_RE = re.compile(r"dtdl/dtdl/(v[234])")
+_DTDL_VERSIONS = {"v3": DTDLVersion.V3, "v4": DTDLVersion.V4}
+
+
+# Empty MD5 context; copying it is cheaper than constructing a new hasher
+_MD5_PROTOTYPE = hashlib.md5(usedforsecurity=False)
+
+
+@lru_cache(maxsize=8192)
+def _property_id_suffix(property_name: str) -> str:
+    """
+    Return the 4-digit ID suffix derived from a property name.
+    
+    The suffix is the first 32 bits of the name's MD5 digest modulo 10000.
+    MD5 is kept (rather than a faster hash) so generated IDs stay stable
+    across releases; the result only depends on the name, so it is cached.
+    """
+    hasher = _MD5_PROTOTYPE.copy()
+    hasher.update(property_name.encode())
+    digest = hasher.digest()
+    return f"{int.from_bytes(digest[:4], 'big') % 10000:04d}"
+
+
+# definition.json is always the empty object
+_EMPTY_DEFINITION_PAYLOAD = base64.b64encode(b"{}").decode()
+
+
+def _definition_part(path: str, content: Dict[str, Any]) -> Dict[str, str]:
+    """Build one InlineBase64 part of a Fabric ontology definition."""
+    return {
+        "path": path,
+        "payload": base64.b64encode(_json.dumps_bytes(content)).decode(),
+        "payloadType": "InlineBase64"
+    }
+
 
 class ComponentMode(str, Enum):
     """Component handling modes for DTDL to Fabric conversion."""
@@ -118,7 +203,12 @@ class ScaledDecimalMode(str, Enum):
     CALCULATED = "calculated"  # Store calculated numeric value as Double
 
 
-@dataclass
+# Powers of ten for the scales seen in practice; identical to 10 ** scale
+_POW10_POS = tuple(10 ** i for i in range(31))
+_POW10_NEG = tuple(10 ** -i for i in range(31))
+
+
+@dataclass(frozen=True)
 class ScaledDecimalValue:
     """
     Represents a parsed scaledDecimal value.
@@ -130,6 +220,9 @@ class ScaledDecimalValue:
         scale: Count of decimal places to shift (positive=left, negative=right)
         value: The significand as a decimal string
     """
+    # Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("scale", "value")
+    
     scale: int
     value: str
     
@@ -144,9 +237,14 @@ class ScaledDecimalValue:
             ScaledDecimalValue(scale=7, value="1234.56").calculate_actual_value()
             # Returns 12345600000.0
         """
+        scale = self.scale
         try:
             base_value = float(self.value)
-            return base_value * (10 ** self.scale)
+            if 0 <= scale <= 30:
+                return base_value * _POW10_POS[scale]
+            if -30 <= scale < 0:
+                return base_value * _POW10_NEG[-scale]
+            return base_value * (10 ** scale)
         except (ValueError, OverflowError):
             return float('nan')
     
@@ -215,7 +313,7 @@ class DTDLToFabricConverter:
         """
         self.id_prefix = id_prefix
         self.namespace = namespace
-        self.scaled_decimal_mode = scaled_decimal_mode
+        self.scaled_decimal_mode = scaled_decimal_mode  # also binds _string_schema_type
         
         self.component_mode = component_mode
         self.command_mode = command_mode
@@ -228,36 +326,104 @@ class DTDLToFabricConverter:
         # Track property names and types across the entire hierarchy
         # Used to detect and resolve conflicts
         self._property_registry: Dict[str, str] = {}  # property_name -> first_seen_type
+        
+        # Ancestor property types per interface DTMI, filled on first lookup
+        self._ancestor_props_cache: Dict[str, Dict[str, str]] = {}
+        
+        # (interface DTMI, content name) -> (Fabric value type, is scaledDecimal),
+        # classified once per conversion for every property and telemetry
+        self._prop_type_cache: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        
+        # External component schema DTMI -> stub entity emitted for it
+        self._stub_entities: Dict[str, EntityType] = {}
+    
+    @property
+    def scaled_decimal_mode(self) -> ScaledDecimalMode:
+        """How scaledDecimal properties are converted."""
+        return self._scaled_decimal_mode
+    
+    @scaled_decimal_mode.setter
+    def scaled_decimal_mode(self, mode: ScaledDecimalMode) -> None:
+        self._scaled_decimal_mode = mode
+        # Pick the schema tables once so lookups need no mode check
+        if mode == ScaledDecimalMode.CALCULATED:
+            self._string_schema_type = _CALCULATED_FABRIC_TYPES.get
+            self._complex_schema_type = _CALCULATED_COMPLEX_FABRIC_TYPES.get
+        else:
+            self._string_schema_type = _DTDL_FABRIC_TYPES.get
+            self._complex_schema_type = _COMPLEX_FABRIC_TYPES.get
     
     def _get_ancestor_properties(self, interface: DTDLInterface) -> Dict[str, str]:
         """
         Get all property names and types from ancestor interfaces.
         
+        Results are memoized per DTMI for the current conversion (filled
+        parents-first right after the topological sort), so each ancestor
+        chain is resolved once no matter how many properties look it up.
+        The returned dict is shared and must not be modified.
+        
         Args:
             interface: The interface to check ancestors for
             
         Returns:
             Dict mapping property name to Fabric value type
         """
-        ancestor_props: Dict[str, str] = {}
+        cached = self._ancestor_props_cache.get(interface.dtmi)
+        if cached is not None:
+            return cached
+        
+        # Not filled yet: collect the uncached ancestors breadth-first and
+        # fill the memo for them parents-first
+        pending = [interface]
+        seen = {interface.dtmi}
+        queue = deque(interface.extends)
+        while queue:
+            dtmi = queue.popleft()
+            if dtmi in seen or dtmi in self._ancestor_props_cache:
+                continue
+            seen.add(dtmi)
+            parent = self._interface_map.get(dtmi)
+            if parent is not None:
+                pending.append(parent)
+                queue.extend(parent.extends)
+        
+        self._fill_ancestor_properties(self._topological_sort(pending))
+        return self._ancestor_props_cache[interface.dtmi]
+    
+    def _fill_ancestor_properties(self, sorted_interfaces: List[DTDLInterface]) -> None:
+        """
+        Memoize ancestor properties for interfaces sorted parents-first.
         
-        for parent_dtmi in interface.extends:
-            if parent_dtmi in self._interface_map:
-                parent = self._interface_map[parent_dtmi]
-                # Add parent's direct properties
-                for prop in parent.properties:
-                    prop_type = self._schema_to_fabric_type(prop.schema)
-                    ancestor_props[prop.name] = prop_type
-                # Recursively add grandparent properties
-                ancestor_props.update(self._get_ancestor_properties(parent))
-        
-        return ancestor_props
+        Each interface merges its parents' direct properties with their
+        already-memoized ancestor properties, so no recursion is needed.
+        Parents not yet memoized (inheritance cycles) contribute only their
+        direct properties.
+        
+        Args:
+            sorted_interfaces: Interfaces in topological order
+        """
+        cache = self._ancestor_props_cache
+        interface_map = self._interface_map
+        content_type = self._content_type
+        
+        for interface in sorted_interfaces:
+            ancestor_props: Dict[str, str] = {}
+            for parent_dtmi in interface.extends:
+                parent = interface_map.get(parent_dtmi)
+                if parent is not None:
+                    # Add parent's direct properties
+                    for prop in parent.properties:
+                        ancestor_props[prop.name] = content_type(parent_dtmi, prop)[0]
+                    # Add grandparent properties
+                    ancestor_props.update(cache.get(parent_dtmi, ()))
+            cache[interface.dtmi] = ancestor_props
     
     def _resolve_property_name(
         self,
         prop_name: str,
         prop_type: str,
-        interface: DTDLInterface
+        interface: DTDLInterface,
+        ancestor_props: Optional[Dict[str, str]] = None
     ) -> str:
         """
         Resolve a property name, adding type suffix if there's a conflict.
@@ -266,15 +432,18 @@ class DTDLToFabricConverter:
             prop_name: Original property name
             prop_type: Fabric value type of the property
             interface: The interface containing the property
+            ancestor_props: The interface's ancestor properties, if already
+                looked up by the caller
             
         Returns:
             Resolved property name (possibly with type suffix)
         """
         # Check if this property name exists in ancestors with a different type
-        ancestor_props = self._get_ancestor_properties(interface)
+        if ancestor_props is None:
+            ancestor_props = self._get_ancestor_properties(interface)
         
-        if prop_name in ancestor_props:
-            ancestor_type = ancestor_props[prop_name]
+        ancestor_type = ancestor_props.get(prop_name)
+        if ancestor_type is not None:
             if ancestor_type != prop_type:
                 # Conflict detected - add type suffix
                 type_suffix = prop_type.lower()
@@ -286,22 +455,18 @@ class DTDLToFabricConverter:
                 )
                 return resolved_name
         
-        # Check global registry for sibling conflicts
-        registry_key = prop_name
-        if registry_key in self._property_registry:
-            registered_type = self._property_registry[registry_key]
-            if registered_type != prop_type:
-                # Sibling conflict - add type suffix
-                type_suffix = prop_type.lower()
-                resolved_name = f"{prop_name}_{type_suffix}"
-                logger.debug(
-                    f"Property '{prop_name}' in {interface.name} has sibling with different type. "
-                    f"Using name '{resolved_name}'"
-                )
-                return resolved_name
-        else:
-            # Register this property name and type
-            self._property_registry[registry_key] = prop_type
+        # Check global registry for sibling conflicts; registers the name
+        # and type on first sight
+        registered_type = self._property_registry.setdefault(prop_name, prop_type)
+        if registered_type != prop_type:
+            # Sibling conflict - add type suffix
+            type_suffix = prop_type.lower()
+            resolved_name = f"{prop_name}_{type_suffix}"
+            logger.debug(
+                f"Property '{prop_name}' in {interface.name} has sibling with different type. "
+                f"Using name '{resolved_name}'"
+            )
+            return resolved_name
         
         return prop_name
     
@@ -315,20 +480,70 @@ class DTDLToFabricConverter:
         Returns:
             ConversionResult with entity types, relationships, and any skipped items
         """
-        result = ConversionResult()
+        return self._convert_indexed(interfaces)
+    
+    def convert_with_validation(
+        self,
+        interfaces: List[DTDLInterface],
+        validator: Optional[DTDLValidator] = None
+    ) -> Tuple[Optional[ConversionResult], ValidationResult]:
+        """
+        Validate DTDL interfaces and convert them if validation passes.
         
-        # Reset property registry for this conversion
-        self._property_registry = {}
+        The DTMI lookup table built during validation is reused for conversion,
+        and conversion is skipped entirely when validation reports errors.
+        
+        Args:
+            interfaces: List of parsed DTDL interfaces
+            validator: Validator to use (defaults to DTDLValidator())
+            
+        Returns:
+            Tuple of (ConversionResult or None if validation failed, ValidationResult)
+        """
+        if validator is None:
+            validator = DTDLValidator()
+        
+        validation_result, interface_map = validator.validate_indexed(interfaces)
+        if validation_result.errors:
+            return None, validation_result
         
-        # Build interface map for lookups
-        self._interface_map = {iface.dtmi: iface for iface in interfaces}
+        return self._convert_indexed(interfaces, interface_map), validation_result
+    
+    def _convert_indexed(
+        self,
+        interfaces: List[DTDLInterface],
+        interface_map: Optional[Dict[str, DTDLInterface]] = None
+    ) -> ConversionResult:
+        """Convert interfaces, reusing a prebuilt DTMI -> interface mapping if given."""
+        result = ConversionResult()
         
-        # Pre-generate Fabric IDs for all interfaces
+        # Reset per-conversion lookup state
+        self._property_registry = {}
+        self._ancestor_props_cache = {}
+        self._stub_entities = {}
+        
+        build_map = interface_map is None
+        if build_map:
+            interface_map = {}
+        self._interface_map = interface_map
+        
+        # Single setup pass: index interfaces, pre-generate Fabric IDs and
+        # classify every property/telemetry schema
+        prop_types: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        classify = self._classify_schema
+        get_fabric_id = self._get_or_create_fabric_id
         for interface in interfaces:
-            self._get_or_create_fabric_id(interface.dtmi)
+            dtmi = interface.dtmi
+            if build_map:
+                interface_map[dtmi] = interface
+            get_fabric_id(dtmi)
+            for content in chain(interface.properties, interface.telemetries):
+                prop_types[(dtmi, content.name)] = classify(content.schema)
+        self._prop_type_cache = prop_types
         
         # Sort interfaces so parents come before children
         sorted_interfaces = self._topological_sort(interfaces)
+        self._fill_ancestor_properties(sorted_interfaces)
         
         # Convert each interface
         for interface in sorted_interfaces:
@@ -346,9 +561,12 @@ class DTDLToFabricConverter:
         
         # Convert relationships (second pass to ensure all entity IDs exist)
         for interface in interfaces:
+            if not interface.relationships:
+                continue
+            source_id = self._get_or_create_fabric_id(interface.dtmi)
             for rel in interface.relationships:
                 try:
-                    rel_type = self._convert_relationship(rel, interface)
+                    rel_type = self._convert_relationship(rel, interface, source_id)
                     if rel_type:
                         result.relationship_types.append(rel_type)
                 except Exception as e:
@@ -409,7 +627,8 @@ class DTDLToFabricConverter:
     def convert_with_compliance_report(
         self,
         interfaces: List[DTDLInterface],
-        dtdl_version: Optional[str] = None
+        dtdl_version: Optional[str] = None,
+        generate_report: bool = True
     ) -> Tuple[ConversionResult, Optional["ConversionReport"]]:
         """
         Convert DTDL interfaces to Fabric format with a compliance report.
@@ -424,65 +643,91 @@ class DTDLToFabricConverter:
             interfaces: List of parsed DTDL interfaces
             dtdl_version: Optional DTDL version string ("v2", "v3", "v4")
                          If None, auto-detected from interface contexts
+            generate_report: If False, skip report generation and return
+                             only the conversion result
         
         Returns:
             Tuple of (ConversionResult, ConversionReport or None)
-            The report may be None if compliance module is not available
+            The report is None if not requested or the compliance module
+            is not available
         """
         # Perform standard conversion
         result = self.convert(interfaces)
         
-        # Generate compliance report if module is available
+        if not generate_report or ConversionReportGenerator is None:
+            return result, None
+        
+        # Generate compliance report
         report = None
-        if ConversionReportGenerator is not None:
-            # Auto-detect DTDL version if not specified
-            detected_version = dtdl_version
-            if not detected_version and interfaces:
-                # Check first interface's context for version hint
-                first_iface = interfaces[0]
-                if hasattr(first_iface, 'context') and first_iface.context:
-                    ctx = first_iface.context[0] if isinstance(first_iface.context, list) else first_iface.context
-                    if "dtdl/dtdl/v4" in ctx.lower():
-                        detected_version = "v4"
-                    elif "dtdl/dtdl/v3" in ctx.lower():
-                        detected_version = "v3"
-                    else:
-                        detected_version = "v2"
-            
-            # Convert to DTDLVersion enum
-            version_enum = None
-            if DTDLVersion is not None:
-                if detected_version == "v4":
-                    version_enum = DTDLVersion.V4
-                elif detected_version == "v3":
-                    version_enum = DTDLVersion.V3
-                else:
-                    version_enum = DTDLVersion.V2
+        # Auto-detect DTDL version if not specified
+        detected_version = dtdl_version
+        if not detected_version and interfaces:
+            # Check first interface's context for version hint
+            first_iface = interfaces[0]
+            if hasattr(first_iface, 'context') and first_iface.context:
+                ctx = first_iface.context[0] if isinstance(first_iface.context, list) else first_iface.context
+                match = _CONTEXT_VERSION_RE.search(ctx.lower())
+                detected_version = match.group(1) if match else "v2"
+        
+        # Convert to DTDLVersion enum
+        version_enum = _DTDL_VERSIONS.get(detected_version, DTDLVersion.V2)
+        
+        try:
+            report = ConversionReportGenerator.generate_dtdl_report(
+                interfaces=interfaces,
+                conversion_result=result,
+                dtdl_version=version_enum
+            )
             
-            try:
-                report = ConversionReportGenerator.generate_dtdl_report(
-                    interfaces=interfaces,
-                    conversion_result=result,
-                    dtdl_version=version_enum
-                )
-                
-                # Log conversion warnings
-                for warning in report.warnings:
-                    logger.warning(
-                        f"Conversion warning [{warning.impact.value}]: "
-                        f"{warning.feature} - {warning.message}"
-                    )
-                
-                # Log summary
-                logger.info(
-                    f"Compliance report: {report.total_issues} issues, "
-                    f"{len(report.warnings)} conversion warnings"
+            # Log conversion warnings
+            for warning in report.warnings:
+                logger.warning(
+                    f"Conversion warning [{warning.impact.value}]: "
+                    f"{warning.feature} - {warning.message}"
                 )
-            except Exception as e:
-                logger.warning(f"Failed to generate compliance report: {e}")
+            
+            # Log summary
+            logger.info(
+                f"Compliance report: {report.total_issues} issues, "
+                f"{len(report.warnings)} conversion warnings"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate compliance report: {e}")
         
         return result, report
     
+    def _classify_schema(self, schema) -> Tuple[str, bool]:
+        """
+        Classify a property or telemetry schema.
+        
+        Args:
+            schema: DTDL schema (string or complex type)
+            
+        Returns:
+            Tuple of (Fabric value type, whether the schema is scaledDecimal)
+        """
+        return (
+            self._schema_to_fabric_type(schema),
+            isinstance(schema, DTDLScaledDecimal) or schema == "scaledDecimal",
+        )
+    
+    def _content_type(self, interface_dtmi: str, content) -> Tuple[str, bool]:
+        """
+        Look up the classification of a property or telemetry.
+        
+        Args:
+            interface_dtmi: DTMI of the interface declaring the content
+            content: DTDLProperty or DTDLTelemetry
+            
+        Returns:
+            Tuple of (Fabric value type, whether the schema is scaledDecimal)
+        """
+        entry = self._prop_type_cache.get((interface_dtmi, content.name))
+        if entry is None:
+            # Not part of the current conversion
+            entry = self._classify_schema(content.schema)
+        return entry
+    
     def _get_or_create_fabric_id(self, dtmi: str) -> str:
         """
         Get or create a Fabric-compatible ID for a DTMI.
@@ -495,14 +740,15 @@ class DTDLToFabricConverter:
         Returns:
             Fabric-compatible numeric string ID
         """
-        if dtmi in self._dtmi_to_fabric_id:
-            return self._dtmi_to_fabric_id[dtmi]
+        fabric_id = self._dtmi_to_fabric_id.get(dtmi)
+        if fabric_id is not None:
+            return fabric_id
         
-        # Remove dtmi: prefix and version for consistent hashing
-        clean_dtmi = dtmi.replace("dtmi:", "").split(";")[0]
+        # Remove version and dtmi: prefix for consistent hashing
+        clean_dtmi = dtmi.partition(";")[0].replace("dtmi:", "")
         
-        # Create deterministic hash
-        hash_bytes = hashlib.sha256(clean_dtmi.encode()).digest()
+        # Create deterministic hash (SHA-256 is kept so existing IDs stay stable)
+        hash_bytes = hashlib.sha256(clean_dtmi.encode(), usedforsecurity=False).digest()
         hash_int = int.from_bytes(hash_bytes[:8], 'big')
         
         # Apply prefix and limit to reasonable range
@@ -523,8 +769,7 @@ class DTDLToFabricConverter:
             Unique property ID string
         """
         # Hash property name to create deterministic sub-ID
-        prop_hash = hashlib.md5(property_name.encode()).hexdigest()[:8]
-        return f"{base_id}{int(prop_hash, 16) % 10000:04d}"
+        return base_id + _property_id_suffix(property_name)
     
     def _convert_interface(self, interface: DTDLInterface) -> EntityType:
         """
@@ -557,36 +802,59 @@ class DTDLToFabricConverter:
                     f"using only first: {parent_dtmi}"
                 )
         
-        # Convert properties
-        properties: List[EntityTypeProperty] = []
-        timeseries_properties: List[EntityTypeProperty] = []
-        
-        display_name_property_id: Optional[str] = None
+        # Looked up once and shared by all property/telemetry conflict checks
+        ancestor_props = self._get_ancestor_properties(interface)
         
-        # Process Properties
+        # Process Properties. In STRUCTURED mode the scaledDecimal _scale and
+        # _value properties are built in the same pass but appended after the
+        # command and component properties, as before.
+        convert_property = self._convert_property
+        properties: List[EntityTypeProperty] = []
+        scaled_decimal_properties: List[EntityTypeProperty] = []
+        structured = self.scaled_decimal_mode == ScaledDecimalMode.STRUCTURED
         for prop in interface.properties:
-            entity_prop = self._convert_property(prop, fabric_id, interface)
-            properties.append(entity_prop)
+            properties.append(convert_property(prop, fabric_id, interface, ancestor_props))
             
-            # Use first string property as display name
-            if display_name_property_id is None and entity_prop.valueType == "String":
-                display_name_property_id = entity_prop.id
+            if structured and self._content_type(interface.dtmi, prop)[1]:
+                # Add _scale and _value suffix properties
+                scale_name = f"{prop.name}_scale"
+                value_name = f"{prop.name}_value"
+                scaled_decimal_properties += (
+                    EntityTypeProperty(
+                        self._create_property_id(fabric_id, scale_name),
+                        self._sanitize_name(scale_name),
+                        "BigInt",
+                    ),
+                    EntityTypeProperty(
+                        self._create_property_id(fabric_id, value_name),
+                        self._sanitize_name(value_name),
+                        "String",
+                    ),
+                )
+        
+        # Use first string property as display name
+        display_name_property_id: Optional[str] = next(
+            (p.id for p in properties if p.valueType == "String"), None
+        )
         
         # Process Telemetry as timeseries properties
-        for telemetry in interface.telemetries:
-            entity_prop = self._convert_telemetry(telemetry, fabric_id, interface)
-            timeseries_properties.append(entity_prop)
+        convert_telemetry = self._convert_telemetry
+        timeseries_properties: List[EntityTypeProperty] = [
+            convert_telemetry(telemetry, fabric_id, interface, ancestor_props)
+            for telemetry in interface.telemetries
+        ]
         
         # Optionally process Commands
         if self.command_mode == CommandMode.PROPERTY:
-            for command in interface.commands:
-                # Create a string property to represent the command
-                cmd_prop = EntityTypeProperty(
-                    id=self._create_property_id(fabric_id, f"cmd_{command.name}"),
-                    name=f"command_{command.name}",
-                    valueType="String",
+            # Create a string property to represent each command
+            properties.extend(
+                EntityTypeProperty(
+                    self._create_property_id(fabric_id, f"cmd_{command.name}"),
+                    f"command_{command.name}",
+                    "String",
                 )
-                properties.append(cmd_prop)
+                for command in interface.commands
+            )
         
         # Optionally flatten Components (legacy mode)
         if self.component_mode == ComponentMode.FLATTEN:
@@ -594,22 +862,8 @@ class DTDLToFabricConverter:
                 component_props = self._flatten_component(component, fabric_id)
                 properties.extend(component_props)
         
-        # Handle scaledDecimal properties in STRUCTURED mode
-        if self.scaled_decimal_mode == ScaledDecimalMode.STRUCTURED:
-            for prop in interface.properties:
-                if isinstance(prop.schema, DTDLScaledDecimal) or prop.schema == "scaledDecimal":
-                    # Add _scale and _value suffix properties
-                    scale_prop = EntityTypeProperty(
-                        id=self._create_property_id(fabric_id, f"{prop.name}_scale"),
-                        name=self._sanitize_name(f"{prop.name}_scale"),
-                        valueType="BigInt",
-                    )
-                    value_prop = EntityTypeProperty(
-                        id=self._create_property_id(fabric_id, f"{prop.name}_value"),
-                        name=self._sanitize_name(f"{prop.name}_value"),
-                        valueType="String",
-                    )
-                    properties.extend([scale_prop, value_prop])
+        # scaledDecimal properties in STRUCTURED mode
+        properties += scaled_decimal_properties
         
         # Build preliminary entity for entityIdParts inference
         entity = EntityType(
@@ -628,9 +882,10 @@ class DTDLToFabricConverter:
         # Use EntityIdPartsInferrer if available, otherwise fallback to legacy logic
         if EntityIdPartsInferrer is not None:
             inferrer = EntityIdPartsInferrer(strategy="auto")
-            entity.entityIdParts = inferrer.infer_entity_id_parts(entity)
+            index = inferrer.index_properties(properties)
+            entity.entityIdParts = inferrer.infer_entity_id_parts(entity, index)
             if not entity.displayNamePropertyId:
-                inferrer.set_display_name_property(entity)
+                inferrer.set_display_name_property(entity, index)
         else:
             # Legacy fallback: use first BigInt property if available
             for prop in properties:
@@ -650,7 +905,8 @@ class DTDLToFabricConverter:
         self,
         prop: DTDLProperty,
         entity_id: str,
-        interface: DTDLInterface
+        interface: DTDLInterface,
+        ancestor_props: Optional[Dict[str, str]] = None
     ) -> EntityTypeProperty:
         """
         Convert a DTDL Property to a Fabric EntityTypeProperty.
@@ -659,26 +915,30 @@ class DTDLToFabricConverter:
             prop: The DTDL property
             entity_id: Parent entity's Fabric ID
             interface: The interface containing this property (for conflict resolution)
+            ancestor_props: Precomputed ancestor properties of ``interface``
             
         Returns:
             Fabric EntityTypeProperty
         """
-        value_type = self._schema_to_fabric_type(prop.schema)
+        value_type = self._content_type(interface.dtmi, prop)[0]
         
         # Resolve property name to handle conflicts with ancestors/siblings
-        resolved_name = self._resolve_property_name(prop.name, value_type, interface)
+        resolved_name = self._resolve_property_name(
+            prop.name, value_type, interface, ancestor_props
+        )
         
         return EntityTypeProperty(
-            id=self._create_property_id(entity_id, resolved_name),
-            name=self._sanitize_name(resolved_name),
-            valueType=value_type,
+            self._create_property_id(entity_id, resolved_name),
+            self._sanitize_name(resolved_name),
+            value_type,
         )
     
     def _convert_telemetry(
         self,
         telemetry: DTDLTelemetry,
         entity_id: str,
-        interface: DTDLInterface
+        interface: DTDLInterface,
+        ancestor_props: Optional[Dict[str, str]] = None
     ) -> EntityTypeProperty:
         """
         Convert a DTDL Telemetry to a Fabric timeseries property.
@@ -687,25 +947,29 @@ class DTDLToFabricConverter:
             telemetry: The DTDL telemetry element
             entity_id: Parent entity's Fabric ID
             interface: The interface containing this telemetry (for conflict resolution)
+            ancestor_props: Precomputed ancestor properties of ``interface``
             
         Returns:
             Fabric EntityTypeProperty (for timeseriesProperties)
         """
-        value_type = self._schema_to_fabric_type(telemetry.schema)
+        value_type = self._content_type(interface.dtmi, telemetry)[0]
         
         # Resolve property name to handle conflicts with ancestors/siblings
-        resolved_name = self._resolve_property_name(telemetry.name, value_type, interface)
+        resolved_name = self._resolve_property_name(
+            telemetry.name, value_type, interface, ancestor_props
+        )
         
         return EntityTypeProperty(
-            id=self._create_property_id(entity_id, f"ts_{resolved_name}"),
-            name=self._sanitize_name(resolved_name),
-            valueType=value_type,
+            self._create_property_id(entity_id, f"ts_{resolved_name}"),
+            self._sanitize_name(resolved_name),
+            value_type,
         )
     
     def _convert_relationship(
         self,
         rel: DTDLRelationship,
-        source_interface: DTDLInterface
+        source_interface: DTDLInterface,
+        source_id: Optional[str] = None
     ) -> Optional[RelationshipType]:
         """
         Convert a DTDL Relationship to a Fabric RelationshipType.
@@ -713,11 +977,13 @@ class DTDLToFabricConverter:
         Args:
             rel: The DTDL relationship
             source_interface: The interface containing the relationship
+            source_id: Fabric ID of ``source_interface``, if already known
             
         Returns:
             Fabric RelationshipType, or None if target is not resolvable
         """
-        source_id = self._get_or_create_fabric_id(source_interface.dtmi)
+        if source_id is None:
+            source_id = self._get_or_create_fabric_id(source_interface.dtmi)
         
         # Determine target ID
         if rel.target:
@@ -763,73 +1029,67 @@ class DTDLToFabricConverter:
         """
         # Look up the component's interface schema
         component_interface = self._interface_map.get(component.schema)
+        target_id = self._get_or_create_fabric_id(component.schema)
+        
+        # Every component gets its own "hasComponent" relationship
+        rel_type = RelationshipType(
+            id=self._create_property_id(source_entity_id, f"comp_{component.name}"),
+            name=self._sanitize_name(f"has_{component.name}"),
+            source=RelationshipEnd(entityTypeId=source_entity_id),
+            target=RelationshipEnd(entityTypeId=target_id),
+            namespace=self.namespace,
+            namespaceType="Custom",
+        )
         
         if component_interface:
             # Component references an interface we already converted
-            # Just create the relationship
-            target_id = self._get_or_create_fabric_id(component.schema)
-            
-            rel_id = self._create_property_id(source_entity_id, f"comp_{component.name}")
-            rel_type = RelationshipType(
-                id=rel_id,
-                name=self._sanitize_name(f"has_{component.name}"),
-                source=RelationshipEnd(entityTypeId=source_entity_id),
-                target=RelationshipEnd(entityTypeId=target_id),
-                namespace=self.namespace,
-                namespaceType="Custom",
-            )
-            
             logger.info(
                 f"Component '{component.name}' converted to relationship to existing "
                 f"interface '{component_interface.name}'"
             )
             return None, rel_type
-        else:
-            # Component references an external interface - create stub entity
-            stub_entity_id = self._get_or_create_fabric_id(component.schema)
-            
-            # Extract name from schema DTMI
-            schema_name = component.schema.replace("dtmi:", "").split(";")[0].split(":")[-1]
-            
-            stub_entity = EntityType(
-                id=stub_entity_id,
-                name=self._sanitize_name(f"{component.name}_{schema_name}"),
-                namespace=self.namespace,
-                namespaceType="Custom",
-                visibility="Visible",
-                baseEntityTypeId=None,
-                entityIdParts=[],
-                displayNamePropertyId=None,
-                properties=[
-                    # Add stub identifier property
-                    EntityTypeProperty(
-                        id=self._create_property_id(stub_entity_id, "componentId"),
-                        name="componentId",
-                        valueType="String",
-                    )
-                ],
-                timeseriesProperties=[],
-            )
-            
-            # Set entityIdParts to the stub property
-            stub_entity.entityIdParts = [stub_entity.properties[0].id]
-            
-            # Create relationship
-            rel_id = self._create_property_id(source_entity_id, f"comp_{component.name}")
-            rel_type = RelationshipType(
-                id=rel_id,
-                name=self._sanitize_name(f"has_{component.name}"),
-                source=RelationshipEnd(entityTypeId=source_entity_id),
-                target=RelationshipEnd(entityTypeId=stub_entity_id),
-                namespace=self.namespace,
-                namespaceType="Custom",
-            )
-            
-            logger.warning(
-                f"Component '{component.name}' references external interface "
-                f"'{component.schema}'; created stub entity"
+        
+        if component.schema in self._stub_entities:
+            # External interface already stubbed by an earlier reference
+            logger.info(
+                f"Component '{component.name}' reuses stub entity for external "
+                f"interface '{component.schema}'"
             )
-            return stub_entity, rel_type
+            return None, rel_type
+        
+        # Component references an external interface - create stub entity
+        # Extract name from schema DTMI
+        schema_name = component.schema.partition(";")[0].rpartition(":")[2]
+        
+        stub_entity = EntityType(
+            id=target_id,
+            name=self._sanitize_name(f"{component.name}_{schema_name}"),
+            namespace=self.namespace,
+            namespaceType="Custom",
+            visibility="Visible",
+            baseEntityTypeId=None,
+            entityIdParts=[],
+            displayNamePropertyId=None,
+            properties=[
+                # Add stub identifier property
+                EntityTypeProperty(
+                    self._create_property_id(target_id, "componentId"),
+                    "componentId",
+                    "String",
+                )
+            ],
+            timeseriesProperties=[],
+        )
+        
+        # Set entityIdParts to the stub property
+        stub_entity.entityIdParts = [stub_entity.properties[0].id]
+        self._stub_entities[component.schema] = stub_entity
+        
+        logger.warning(
+            f"Component '{component.name}' references external interface "
+            f"'{component.schema}'; created stub entity"
+        )
+        return stub_entity, rel_type
     
     def _convert_command_to_entity(
         self,
@@ -855,24 +1115,25 @@ class DTDLToFabricConverter:
         cmd_dtmi = command.dtmi or f"{source_interface.dtmi}:cmd:{command.name}"
         cmd_entity_id = self._get_or_create_fabric_id(cmd_dtmi)
         
+        create_property_id = self._create_property_id
+        
         # Build properties from command definition
         properties: List[EntityTypeProperty] = []
         
         # Command name property (identifier)
         name_prop = EntityTypeProperty(
-            id=self._create_property_id(cmd_entity_id, "commandName"),
-            name="commandName",
-            valueType="String",
+            create_property_id(cmd_entity_id, "commandName"),
+            "commandName",
+            "String",
         )
         properties.append(name_prop)
         
         # Request schema as JSON property if present
         if command.request:
-            request_schema = self._command_payload_to_json(command.request)
             req_prop = EntityTypeProperty(
-                id=self._create_property_id(cmd_entity_id, "requestSchema"),
-                name="requestSchema",
-                valueType="String",  # JSON-encoded schema
+                create_property_id(cmd_entity_id, "requestSchema"),
+                "requestSchema",
+                "String",  # JSON-encoded schema
             )
             properties.append(req_prop)
             
@@ -885,11 +1146,10 @@ class DTDLToFabricConverter:
         
         # Response schema as JSON property if present
         if command.response:
-            response_schema = self._command_payload_to_json(command.response)
             resp_prop = EntityTypeProperty(
-                id=self._create_property_id(cmd_entity_id, "responseSchema"),
-                name="responseSchema",
-                valueType="String",  # JSON-encoded schema
+                create_property_id(cmd_entity_id, "responseSchema"),
+                "responseSchema",
+                "String",  # JSON-encoded schema
             )
             properties.append(resp_prop)
             
@@ -915,7 +1175,7 @@ class DTDLToFabricConverter:
         )
         
         # Create relationship from interface to command
-        rel_id = self._create_property_id(source_entity_id, f"cmd_rel_{command.name}")
+        rel_id = create_property_id(source_entity_id, f"cmd_rel_{command.name}")
         cmd_rel = RelationshipType(
             id=rel_id,
             name=self._sanitize_name(f"supports_{command.name}"),
@@ -984,21 +1244,25 @@ class DTDLToFabricConverter:
         
         if isinstance(payload.schema, DTDLObject):
             # Extract each field as a property
+            schema_to_fabric_type = self._schema_to_fabric_type
+            create_property_id = self._create_property_id
+            sanitize_name = self._sanitize_name
+            field_prefix = f"{prefix}_"
             for field in payload.schema.fields:
-                field_type = self._schema_to_fabric_type(field.schema)
-                prop = EntityTypeProperty(
-                    id=self._create_property_id(entity_id, f"{prefix}_{field.name}"),
-                    name=self._sanitize_name(f"{prefix}_{field.name}"),
-                    valueType=field_type,
-                )
-                properties.append(prop)
+                param_name = field_prefix + field.name
+                properties.append(EntityTypeProperty(
+                    create_property_id(entity_id, param_name),
+                    sanitize_name(param_name),
+                    schema_to_fabric_type(field.schema),
+                ))
         elif isinstance(payload.schema, str):
             # Single parameter
             param_type = self._schema_to_fabric_type(payload.schema)
+            param_name = f"{prefix}_{payload.name}"
             prop = EntityTypeProperty(
-                id=self._create_property_id(entity_id, f"{prefix}_{payload.name}"),
-                name=self._sanitize_name(f"{prefix}_{payload.name}"),
-                valueType=param_type,
+                self._create_property_id(entity_id, param_name),
+                self._sanitize_name(param_name),
+                param_type,
             )
             properties.append(prop)
         
@@ -1030,14 +1294,18 @@ class DTDLToFabricConverter:
         # Prefix all properties with component name
         prefix = f"{component.name}_"
         
+        schema = component.schema
+        create_property_id = self._create_property_id
+        sanitize_name = self._sanitize_name
+        content_type = self._content_type
+        append = properties.append
         for prop in component_interface.properties:
             prefixed_name = prefix + prop.name
-            entity_prop = EntityTypeProperty(
-                id=self._create_property_id(parent_entity_id, prefixed_name),
-                name=self._sanitize_name(prefixed_name),
-                valueType=self._schema_to_fabric_type(prop.schema),
-            )
-            properties.append(entity_prop)
+            append(EntityTypeProperty(
+                create_property_id(parent_entity_id, prefixed_name),
+                sanitize_name(prefixed_name),
+                content_type(schema, prop)[0],
+            ))
         
         return properties
     
@@ -1052,55 +1320,16 @@ class DTDLToFabricConverter:
             Fabric value type string
         """
         if isinstance(schema, str):
-            # Handle scaledDecimal in CALCULATED mode
-            if schema == "scaledDecimal" and self.scaled_decimal_mode == ScaledDecimalMode.CALCULATED:
-                return "Double"
-            # Primitive type or DTMI reference
-            return DTDL_TO_FABRIC_TYPE.get(schema, "String")
-        
-        # Complex types
-        if isinstance(schema, DTDLEnum):
-            # Store enum as the value schema type
-            return DTDL_TO_FABRIC_TYPE.get(schema.value_schema, "String")
-        
-        if isinstance(schema, (DTDLObject, DTDLArray, DTDLMap)):
-            # Complex types stored as JSON strings
-            return "String"
-        
-        if isinstance(schema, DTDLScaledDecimal):
-            # Handle based on mode
-            if self.scaled_decimal_mode == ScaledDecimalMode.CALCULATED:
-                return "Double"
-            # JSON_STRING or STRUCTURED mode - base property is String
-            return "String"
-        
-        return "String"
-    
-    def _sanitize_name(self, name: str) -> str:
-        """
-        Sanitize a name to meet Fabric requirements.
-        
-        Fabric names must be alphanumeric with underscores,
-        start with a letter, and be <= 90 characters.
-        
-        Args:
-            name: Original name
-            
-        Returns:
-            Sanitized name
-        """
-        if not name:
-            return "Entity"
-        
-        # Replace invalid characters with underscore
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
-        
-        # Ensure starts with letter
-        if not sanitized[0].isalpha():
-            sanitized = 'E_' + sanitized
+            # Primitive type or DTMI reference (table already reflects
+            # the scaledDecimal mode)
+            return self._string_schema_type(schema, "String")
         
-        # Truncate to max length
-        return sanitized[:90]
+        # Complex types, dispatched on the exact model class
+        fabric_type = self._complex_schema_type(type(schema), _string_fabric_type)
+        return fabric_type(schema)
+    
+    # Names recur across interfaces, so sanitizing goes through a shared cache
+    _sanitize_name = staticmethod(sanitize_name)
     
     def _topological_sort(
         self,
@@ -1119,9 +1348,10 @@ class DTDLToFabricConverter:
         """
         dtmi_to_interface = {iface.dtmi: iface for iface in interfaces}
         
-        # Calculate in-degree (number of parents in the input set)
-        in_degree: Dict[str, int] = {iface.dtmi: 0 for iface in interfaces}
-        children: Dict[str, List[str]] = {iface.dtmi: [] for iface in interfaces}
+        # Calculate in-degree (number of parents in the input set); only
+        # interfaces that have children get a children list
+        in_degree: Dict[str, int] = dict.fromkeys(dtmi_to_interface, 0)
+        children: Dict[str, List[str]] = defaultdict(list)
         
         for interface in interfaces:
             for parent_dtmi in interface.extends:
@@ -1130,22 +1360,24 @@ class DTDLToFabricConverter:
                     children[parent_dtmi].append(interface.dtmi)
         
         # Start with root interfaces (no parents in input set)
-        queue = [dtmi for dtmi, degree in in_degree.items() if degree == 0]
+        queue = deque(dtmi for dtmi, degree in in_degree.items() if degree == 0)
         sorted_list: List[DTDLInterface] = []
         
         while queue:
-            current_dtmi = queue.pop(0)
+            current_dtmi = queue.popleft()
             sorted_list.append(dtmi_to_interface[current_dtmi])
             
-            for child_dtmi in children.get(current_dtmi, []):
+            for child_dtmi in children.get(current_dtmi, ()):
                 in_degree[child_dtmi] -= 1
                 if in_degree[child_dtmi] == 0:
                     queue.append(child_dtmi)
         
-        # Add any remaining (cycle or external parent)
-        for interface in interfaces:
-            if interface not in sorted_list:
-                sorted_list.append(interface)
+        # Add any remaining (cycle or duplicate DTMI), tracked by identity
+        if len(sorted_list) < len(interfaces):
+            emitted = {id(iface) for iface in sorted_list}
+            sorted_list.extend(
+                iface for iface in interfaces if id(iface) not in emitted
+            )
         
         return sorted_list
     
@@ -1169,37 +1401,72 @@ class DTDLToFabricConverter:
         Raises:
             ValueError: If Fabric limits are exceeded (unless skip_fabric_limits=True)
         """
-        import base64
+        return {
+            "parts": list(self.iter_fabric_parts(result, ontology_name, skip_fabric_limits))
+        }
+    
+    def iter_fabric_parts(
+        self,
+        result: ConversionResult,
+        ontology_name: str = "DTDLOntology",
+        skip_fabric_limits: bool = False,
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Yield the Fabric API definition parts one at a time.
         
-        # Validate Fabric API limits (unless explicitly skipped)
-        if not skip_fabric_limits and FabricLimitsValidator is not None:
-            fabric_validator = FabricLimitsValidator()
-            limit_errors = fabric_validator.validate_all(
-                result.entity_types, 
-                result.relationship_types
-            )
-            
-            # Log limit validation issues
-            for error in limit_errors:
-                if error.level == "warning":
-                    logger.warning(f"Fabric limit warning: {error.message}")
-                else:
-                    logger.error(f"Fabric limit error: {error.message}")
+        Same parts, in the same order, as ``to_fabric_definition()["parts"]``,
+        but only one encoded payload is held at a time, so callers writing
+        the parts to a file or request body don't materialize the whole
+        definition. Fabric limits are validated before this returns.
+        
+        Args:
+            result: Conversion result with entity and relationship types
+            ontology_name: Display name for the ontology
+            skip_fabric_limits: If True, skip Fabric API limits validation
             
-            # Fail on critical limit errors
-            if fabric_validator.has_errors(limit_errors):
-                critical_errors = fabric_validator.get_errors_only(limit_errors)
-                error_msg = "Fabric API limit exceeded:\n" + "\n".join(
-                    f"  - {e.message}" for e in critical_errors
-                )
-                raise ValueError(error_msg)
+        Returns:
+            Iterator over part dictionaries
             
-            warnings = fabric_validator.get_warnings_only(limit_errors)
-            if warnings:
-                logger.info(f"Fabric limits check passed with {len(warnings)} warning(s)")
+        Raises:
+            ValueError: If Fabric limits are exceeded (unless skip_fabric_limits=True)
+        """
+        if not skip_fabric_limits and FabricLimitsValidator is not None:
+            self._check_fabric_limits(result)
+        return self._generate_fabric_parts(result, ontology_name)
+    
+    def _check_fabric_limits(self, result: ConversionResult) -> None:
+        """Log Fabric API limit issues and raise ValueError on critical ones."""
+        fabric_validator = FabricLimitsValidator()
+        limit_errors = fabric_validator.validate_all(
+            result.entity_types, 
+            result.relationship_types
+        )
         
-        parts = []
+        # Log limit validation issues
+        for error in limit_errors:
+            if error.level == "warning":
+                logger.warning(f"Fabric limit warning: {error.message}")
+            else:
+                logger.error(f"Fabric limit error: {error.message}")
+        
+        # Fail on critical limit errors
+        if fabric_validator.has_errors(limit_errors):
+            critical_errors = fabric_validator.get_errors_only(limit_errors)
+            error_msg = "Fabric API limit exceeded:\n" + "\n".join(
+                f"  - {e.message}" for e in critical_errors
+            )
+            raise ValueError(error_msg)
         
+        warnings = fabric_validator.get_warnings_only(limit_errors)
+        if warnings:
+            logger.info(f"Fabric limits check passed with {len(warnings)} warning(s)")
+    
+    @staticmethod
+    def _generate_fabric_parts(
+        result: ConversionResult,
+        ontology_name: str
+    ) -> Iterator[Dict[str, str]]:
+        """Encode and yield each definition part."""
         # .platform file
         platform_content = {
             "metadata": {
@@ -1207,44 +1474,24 @@ class DTDLToFabricConverter:
                 "displayName": ontology_name
             }
         }
-        parts.append({
-            "path": ".platform",
-            "payload": base64.b64encode(
-                json.dumps(platform_content, indent=2).encode()
-            ).decode(),
-            "payloadType": "InlineBase64"
-        })
+        yield _definition_part(".platform", platform_content)
         
         # definition.json
-        parts.append({
+        yield {
             "path": "definition.json",
-            "payload": base64.b64encode(b"{}").decode(),
+            "payload": _EMPTY_DEFINITION_PAYLOAD,
             "payloadType": "InlineBase64"
-        })
+        }
         
-        # Entity types
+        # Entity and relationship types, encoded independently of each other
         for entity_type in result.entity_types:
-            entity_content = entity_type.to_dict()
-            parts.append({
-                "path": f"EntityTypes/{entity_type.id}/definition.json",
-                "payload": base64.b64encode(
-                    json.dumps(entity_content, indent=2).encode()
-                ).decode(),
-                "payloadType": "InlineBase64"
-            })
-        
-        # Relationship types
+            yield _definition_part(
+                f"EntityTypes/{entity_type.id}/definition.json", entity_type.to_dict()
+            )
         for rel_type in result.relationship_types:
-            rel_content = rel_type.to_dict()
-            parts.append({
-                "path": f"RelationshipTypes/{rel_type.id}/definition.json",
-                "payload": base64.b64encode(
-                    json.dumps(rel_content, indent=2).encode()
-                ).decode(),
-                "payloadType": "InlineBase64"
-            })
-        
-        return {"parts": parts}
+            yield _definition_part(
+                f"RelationshipTypes/{rel_type.id}/definition.json", rel_type.to_dict()
+            )
     
     def get_dtmi_mapping(self) -> Dict[str, str]:
         """
@@ -9,7 +9,8 @@ https://github.com/Azure/opendigitaltwins-dtdl/blob/master/DTDL/v4/DTDL.v4.md
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Union, Literal
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Mapping, Optional, Union, Literal
 from enum import Enum
 
 
@@ -49,15 +50,18 @@ class DTDLPrimitiveSchema(str, Enum):
     SCALED_DECIMAL = "scaledDecimal"
 
 
-# DTDL v4 Geospatial Schema DTMIs
-GEOSPATIAL_SCHEMA_DTMIS = {
+# DTDL v4 Geospatial Schema DTMIs (schema name -> DTMI), read-only
+GEOSPATIAL_SCHEMA_DTMIS: Mapping[str, str] = MappingProxyType({
     "point": "dtmi:standard:schema:geospatial:point;4",
     "lineString": "dtmi:standard:schema:geospatial:lineString;4",
     "polygon": "dtmi:standard:schema:geospatial:polygon;4",
     "multiPoint": "dtmi:standard:schema:geospatial:multiPoint;4",
     "multiLineString": "dtmi:standard:schema:geospatial:multiLineString;4",
     "multiPolygon": "dtmi:standard:schema:geospatial:multiPolygon;4",
-}
+})
+
+# Membership test for schema references given by DTMI rather than by name
+GEOSPATIAL_SCHEMA_DTMI_SET: FrozenSet[str] = frozenset(GEOSPATIAL_SCHEMA_DTMIS.values())
 
 # DTDL v4 Scaled Decimal Schema DTMI
 SCALED_DECIMAL_SCHEMA_DTMI = "dtmi:standard:schema:scaledDecimal;4"
@@ -733,10 +737,8 @@ class DTDLInterface:
         """
         if not self.dtmi:
             return "Unknown"
-        # Remove dtmi: prefix and version suffix
-        path = self.dtmi.replace("dtmi:", "").split(";")[0]
-        # Get last segment
-        return path.split(":")[-1]
+        # Drop the version suffix and take the last path segment
+        return self.dtmi.partition(";")[0].rpartition(":")[2]
     
     @property
     def resolved_display_name(self) -> str:
@@ -11,12 +11,14 @@ Supports:
 - DTDL versions 2, 3, and 4
 """
 
-import json
 import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Set
 from dataclasses import dataclass, field
 
+from . import _json
 from .dtdl_models import (
     DTDLInterface,
     DTDLProperty,
@@ -41,6 +43,42 @@ from .dtdl_models import (
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """
+    Intern DTMI, schema-name and content-name strings as they leave the parser.
+    
+    The same DTMIs recur as interface ids, extends entries, relationship
+    targets and schema references, and content names recur across
+    interfaces; interning them lets the dict and set lookups downstream
+    (including the converter's per-name registries) compare by identity.
+    Non-strings pass through.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _reintern_interface(interface: DTDLInterface) -> None:
+    """
+    Re-intern the DTMIs and names of an interface parsed in a worker process.
+    
+    Results come back from a process pool by pickling, which creates new
+    string objects; interning them again in the parent restores the sharing
+    _intern provides for in-process parsing.
+    """
+    interface.dtmi = _intern(interface.dtmi)
+    interface.extends = [_intern(e) for e in interface.extends]
+    for content in interface.contents:
+        content.name = _intern(content.name)
+        schema = getattr(content, "schema", None)
+        if type(schema) is str:
+            content.schema = sys.intern(schema)
+        target = getattr(content, "target", None)
+        if target is not None:
+            content.target = _intern(target)
+        semantic_types = getattr(content, "semantic_types", None)
+        if semantic_types:
+            content.semantic_types = [_intern(t) for t in semantic_types]
+
+
 @dataclass
 class ParseError:
     """Represents a parsing error."""
@@ -112,6 +150,23 @@ class DTDLParser:
     # Valid file extensions for DTDL files
     DTDL_EXTENSIONS = {".json", ".dtdl"}
     
+    # Content @type -> (parser method name, whether it takes semantic types)
+    CONTENT_PARSERS = {
+        "Property": ("_parse_property", True),
+        "Telemetry": ("_parse_telemetry", True),
+        "Relationship": ("_parse_relationship", False),
+        "Component": ("_parse_component", False),
+        "Command": ("_parse_command", False),
+    }
+    
+    # Complex schema @type -> parser method name
+    SCHEMA_PARSERS = {
+        "Enum": "_parse_enum",
+        "Object": "_parse_object",
+        "Array": "_parse_array",
+        "Map": "_parse_map",
+    }
+    
     def __init__(self, strict_mode: bool = False):
         """
         Initialize the parser.
@@ -121,6 +176,16 @@ class DTDLParser:
         """
         self.strict_mode = strict_mode
         self._schema_cache: Dict[str, DTDLSchema] = {}
+        
+        # Bind dispatch tables once so each element costs a single dict lookup
+        self._content_parsers = {
+            type_name: (getattr(self, method), with_semantics)
+            for type_name, (method, with_semantics) in self.CONTENT_PARSERS.items()
+        }
+        self._schema_parsers = {
+            type_name: getattr(self, method)
+            for type_name, method in self.SCHEMA_PARSERS.items()
+        }
     
     def parse_file(self, file_path: Union[str, Path]) -> ParseResult:
         """
@@ -147,9 +212,8 @@ class DTDLParser:
             result.warnings.append(f"Unexpected file extension: {path.suffix}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = _json.load_file(path)
+        except _json.JSONDecodeError as e:
             result.errors.append(ParseError(str(path), f"Invalid JSON: {e}"))
             return result
         except UnicodeDecodeError as e:
@@ -169,14 +233,22 @@ class DTDLParser:
     def parse_directory(
         self,
         dir_path: Union[str, Path],
-        recursive: bool = True
+        recursive: bool = True,
+        max_workers: int = 1
     ) -> ParseResult:
         """
         Parse all DTDL files in a directory.
         
+        Files are parsed in-process by default. Passing max_workers > 1 parses
+        them in a process pool instead; results are merged in sorted file
+        order either way. With the "spawn" start method (the default on
+        Windows and macOS) the calling script must guard its entry point
+        with ``if __name__ == "__main__":``.
+        
         Args:
             dir_path: Path to the directory
             recursive: Whether to search subdirectories
+            max_workers: Worker processes to use (default: 1, in-process)
             
         Returns:
             ParseResult with all interfaces and any errors
@@ -206,8 +278,7 @@ class DTDLParser:
         logger.info(f"Found {len(files)} DTDL files in {path}")
         
         # Parse each file
-        for file_path in sorted(files):
-            file_result = self.parse_file(file_path)
+        for file_result in self._parse_files(sorted(files), max_workers):
             result.interfaces.extend(file_result.interfaces)
             result.errors.extend(file_result.errors)
             result.warnings.extend(file_result.warnings)
@@ -215,6 +286,24 @@ class DTDLParser:
         
         return result
     
+    def _parse_files(
+        self,
+        files: List[Path],
+        max_workers: int
+    ) -> List[ParseResult]:
+        """Parse files in order, in a process pool when max_workers > 1."""
+        if max_workers <= 1:
+            return [self.parse_file(file_path) for file_path in files]
+        
+        chunksize = max(1, len(files) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.parse_file, files, chunksize=chunksize))
+        
+        for file_result in results:
+            for interface in file_result.interfaces:
+                _reintern_interface(interface)
+        return results
+    
     def parse_string(self, content: str, source_name: str = "<string>") -> ParseResult:
         """
         Parse DTDL from a JSON string.
@@ -229,8 +318,8 @@ class DTDLParser:
         result = ParseResult()
         
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = _json.loads(content)
+        except _json.JSONDecodeError as e:
             result.errors.append(ParseError(source_name, f"Invalid JSON: {e}"))
             return result
         
@@ -357,9 +446,9 @@ class DTDLParser:
         extends_data = data.get("extends")
         if extends_data:
             if isinstance(extends_data, str):
-                extends = [extends_data]
+                extends = [sys.intern(extends_data)]
             elif isinstance(extends_data, list):
-                extends = [e for e in extends_data if isinstance(e, str)]
+                extends = [sys.intern(e) for e in extends_data if isinstance(e, str)]
         
         # Parse contents
         contents = self._parse_contents(data.get("contents", []), source)
@@ -368,7 +457,7 @@ class DTDLParser:
         schemas = self._parse_schemas(data.get("schemas", []), source)
         
         return DTDLInterface(
-            dtmi=dtmi,
+            dtmi=_intern(dtmi),
             contents=contents,
             extends=extends,
             schemas=schemas,
@@ -395,6 +484,7 @@ class DTDLParser:
             List of parsed content objects
         """
         parsed = []
+        content_parsers = self._content_parsers
         
         for item in contents:
             if not isinstance(item, dict):
@@ -405,24 +495,22 @@ class DTDLParser:
             if isinstance(type_val, list):
                 # First element is the base type
                 base_type = type_val[0]
-                semantic_types = type_val[1:] if len(type_val) > 1 else []
+                semantic_types = [_intern(t) for t in type_val[1:]]
             else:
                 base_type = type_val
                 semantic_types = []
             
+            entry = content_parsers.get(base_type) if isinstance(base_type, str) else None
+            if entry is None:
+                logger.warning(f"{source}: Unknown content type: {base_type}")
+                continue
+            
+            parse, with_semantics = entry
             try:
-                if base_type == "Property":
-                    parsed.append(self._parse_property(item, semantic_types))
-                elif base_type == "Telemetry":
-                    parsed.append(self._parse_telemetry(item, semantic_types))
-                elif base_type == "Relationship":
-                    parsed.append(self._parse_relationship(item))
-                elif base_type == "Component":
-                    parsed.append(self._parse_component(item))
-                elif base_type == "Command":
-                    parsed.append(self._parse_command(item))
+                if with_semantics:
+                    parsed.append(parse(item, semantic_types))
                 else:
-                    logger.warning(f"{source}: Unknown content type: {base_type}")
+                    parsed.append(parse(item))
             except Exception as e:
                 logger.warning(f"{source}: Error parsing {base_type}: {e}")
         
@@ -441,7 +529,7 @@ class DTDLParser:
         schema = self._parse_schema(data.get("schema"))
         
         return DTDLProperty(
-            name=name,
+            name=_intern(name),
             schema=schema,
             writable=data.get("writable", False),
             dtmi=data.get("@id"),
@@ -465,7 +553,7 @@ class DTDLParser:
         schema = self._parse_schema(data.get("schema"))
         
         return DTDLTelemetry(
-            name=name,
+            name=_intern(name),
             schema=schema,
             dtmi=data.get("@id"),
             display_name=data.get("displayName"),
@@ -488,8 +576,8 @@ class DTDLParser:
                 properties.append(self._parse_property(prop_data))
         
         return DTDLRelationship(
-            name=name,
-            target=data.get("target"),
+            name=_intern(name),
+            target=_intern(data.get("target")),
             min_multiplicity=data.get("minMultiplicity", 0),
             max_multiplicity=data.get("maxMultiplicity"),
             writable=data.get("writable", False),
@@ -515,8 +603,8 @@ class DTDLParser:
             raise ValueError("Component schema must be a DTMI string")
         
         return DTDLComponent(
-            name=name,
-            schema=schema,
+            name=_intern(name),
+            schema=sys.intern(schema),
             dtmi=data.get("@id"),
             display_name=data.get("displayName"),
             description=data.get("description"),
@@ -538,7 +626,7 @@ class DTDLParser:
             response = self._parse_command_payload(data["response"])
         
         return DTDLCommand(
-            name=name,
+            name=_intern(name),
             request=request,
             response=response,
             dtmi=data.get("@id"),
@@ -582,28 +670,21 @@ class DTDLParser:
             # Handle scaledDecimal as a string reference (DTDL v4)
             if schema == "scaledDecimal":
                 return DTDLScaledDecimal()
-            return schema  # Primitive type or DTMI reference
+            return sys.intern(schema)  # Primitive type or DTMI reference
         
         if isinstance(schema, dict):
             schema_type = schema.get("@type")
-            
-            if schema_type == "Enum":
-                return self._parse_enum(schema)
-            elif schema_type == "Object":
-                return self._parse_object(schema)
-            elif schema_type == "Array":
-                return self._parse_array(schema)
-            elif schema_type == "Map":
-                return self._parse_map(schema)
-            else:
+            parse = self._schema_parsers.get(schema_type) if isinstance(schema_type, str) else None
+            if parse is None:
                 logger.warning(f"Unknown schema type: {schema_type}")
                 return "string"
+            return parse(schema)
         
         return "string"
     
     def _parse_enum(self, data: Dict[str, Any]) -> DTDLEnum:
         """Parse an Enum schema."""
-        value_schema = data.get("valueSchema", "integer")
+        value_schema = _intern(data.get("valueSchema", "integer"))
         
         enum_values = []
         for ev_data in data.get("enumValues", []):
@@ -697,24 +778,20 @@ class DTDLParser:
     ) -> List:
         """Parse reusable schemas defined in an Interface."""
         parsed = []
+        schema_parsers = self._schema_parsers
         
         for schema_data in schemas:
             if not isinstance(schema_data, dict):
                 continue
             
             schema_type = schema_data.get("@type")
+            parse = schema_parsers.get(schema_type) if isinstance(schema_type, str) else None
+            if parse is None:
+                logger.warning(f"{source}: Unknown schema type: {schema_type}")
+                continue
             
             try:
-                if schema_type == "Enum":
-                    parsed.append(self._parse_enum(schema_data))
-                elif schema_type == "Object":
-                    parsed.append(self._parse_object(schema_data))
-                elif schema_type == "Array":
-                    parsed.append(self._parse_array(schema_data))
-                elif schema_type == "Map":
-                    parsed.append(self._parse_map(schema_data))
-                else:
-                    logger.warning(f"{source}: Unknown schema type: {schema_type}")
+                parsed.append(parse(schema_data))
             except Exception as e:
                 logger.warning(f"{source}: Error parsing schema: {e}")
         
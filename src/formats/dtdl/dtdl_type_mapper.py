@@ -7,7 +7,8 @@ including handling of complex types, semantic types, and unit information.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Union
 
 from .dtdl_models import (
     DTDLPrimitiveSchema,
@@ -41,8 +42,70 @@ class TypeMappingResult:
     json_schema: Optional[Dict[str, Any]] = None
 
 
+# JSON schema builders for complex types
+def _enum_json_schema(enum: DTDLEnum) -> Dict[str, Any]:
+    return {
+        "type": "enum",
+        "valueSchema": enum.value_schema,
+        "values": [
+            {"name": ev.name, "value": ev.value}
+            for ev in enum.enum_values
+        ]
+    }
+
+
+def _array_json_schema(array: DTDLArray) -> Dict[str, Any]:
+    element_schema = array.element_schema
+    
+    # Get element type for documentation
+    if isinstance(element_schema, str):
+        element_type = element_schema
+    else:
+        element_type = type(element_schema).__name__
+    
+    return {
+        "type": "array",
+        "elementSchema": element_type
+    }
+
+
+def _map_json_schema(map_schema: DTDLMap) -> Dict[str, Any]:
+    return {
+        "type": "map",
+        "mapKey": {
+            "name": map_schema.map_key.name if map_schema.map_key else "key",
+            "schema": map_schema.map_key.schema if map_schema.map_key else "string"
+        },
+        "mapValue": {
+            "name": map_schema.map_value.name if map_schema.map_value else "value",
+            "schema": (
+                map_schema.map_value.schema
+                if map_schema.map_value and isinstance(map_schema.map_value.schema, str)
+                else "object"
+            )
+        }
+    }
+
+
+def _object_json_schema(obj: DTDLObject) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "fields": [
+            {
+                "name": field.name,
+                "schema": (
+                    field.schema
+                    if isinstance(field.schema, str)
+                    else type(field.schema).__name__
+                )
+            }
+            for field in obj.fields
+        ]
+    }
+
+
 # Primitive type mapping
-PRIMITIVE_TYPE_MAP: Dict[str, FabricValueType] = {
+_PRIMITIVE_TYPES: Dict[str, FabricValueType] = {
     # Boolean
     "boolean": FabricValueType.BOOLEAN,
     
@@ -84,6 +147,10 @@ PRIMITIVE_TYPE_MAP: Dict[str, FabricValueType] = {
     "multiPolygon": FabricValueType.STRING,
 }
 
+# Read-only public view; lookups inside this module go straight to the dict
+PRIMITIVE_TYPE_MAP: Mapping[str, FabricValueType] = MappingProxyType(_PRIMITIVE_TYPES)
+_primitive_type = _PRIMITIVE_TYPES.get
+
 
 # DTDL v4 Semantic Types with their associated schemas
 SEMANTIC_TYPE_SCHEMAS: Dict[str, List[str]] = {
@@ -209,7 +276,7 @@ class DTDLTypeMapper:
         unit: Optional[str]
     ) -> TypeMappingResult:
         """Map a primitive DTDL schema to Fabric type."""
-        fabric_type = PRIMITIVE_TYPE_MAP.get(schema, FabricValueType.STRING)
+        fabric_type = _primitive_type(schema, FabricValueType.STRING)
         
         return TypeMappingResult(
             fabric_type=fabric_type,
@@ -227,27 +294,14 @@ class DTDLTypeMapper:
     ) -> TypeMappingResult:
         """Map a DTDL Enum to Fabric type."""
         # Use the enum's value schema for the Fabric type
-        base_type = PRIMITIVE_TYPE_MAP.get(
-            enum.value_schema,
-            FabricValueType.STRING
-        )
-        
-        # Generate JSON schema for documentation
-        json_schema = {
-            "type": "enum",
-            "valueSchema": enum.value_schema,
-            "values": [
-                {"name": ev.name, "value": ev.value}
-                for ev in enum.enum_values
-            ]
-        }
+        base_type = _primitive_type(enum.value_schema, FabricValueType.STRING)
         
         return TypeMappingResult(
             fabric_type=base_type,
             is_complex=True,
             semantic_type=semantic_type,
             original_schema="Enum",
-            json_schema=json_schema,
+            json_schema=_enum_json_schema(enum),
         )
     
     def _map_array(
@@ -257,75 +311,31 @@ class DTDLTypeMapper:
     ) -> TypeMappingResult:
         """Map a DTDL Array to Fabric type."""
         # Arrays are stored as JSON strings in Fabric
-        element_schema = array.element_schema
-        
-        # Get element type for documentation
-        if isinstance(element_schema, str):
-            element_type = element_schema
-        else:
-            element_type = type(element_schema).__name__
-        
-        json_schema = {
-            "type": "array",
-            "elementSchema": element_type
-        }
-        
         return TypeMappingResult(
             fabric_type=FabricValueType.STRING,
             is_complex=True,
             is_array=True,
             semantic_type=semantic_type,
             original_schema="Array",
-            json_schema=json_schema,
+            json_schema=_array_json_schema(array),
         )
     
     def _map_map(self, map_schema: DTDLMap) -> TypeMappingResult:
         """Map a DTDL Map to Fabric type."""
-        json_schema = {
-            "type": "map",
-            "mapKey": {
-                "name": map_schema.map_key.name if map_schema.map_key else "key",
-                "schema": map_schema.map_key.schema if map_schema.map_key else "string"
-            },
-            "mapValue": {
-                "name": map_schema.map_value.name if map_schema.map_value else "value",
-                "schema": (
-                    map_schema.map_value.schema
-                    if map_schema.map_value and isinstance(map_schema.map_value.schema, str)
-                    else "object"
-                )
-            }
-        }
-        
         return TypeMappingResult(
             fabric_type=FabricValueType.STRING,
             is_complex=True,
             original_schema="Map",
-            json_schema=json_schema,
+            json_schema=_map_json_schema(map_schema),
         )
     
     def _map_object(self, obj: DTDLObject) -> TypeMappingResult:
         """Map a DTDL Object to Fabric type."""
-        json_schema = {
-            "type": "object",
-            "fields": [
-                {
-                    "name": field.name,
-                    "schema": (
-                        field.schema
-                        if isinstance(field.schema, str)
-                        else type(field.schema).__name__
-                    )
-                }
-                for field in obj.fields
-            ]
-        }
-        
         return TypeMappingResult(
             fabric_type=FabricValueType.STRING,
             is_complex=True,
             original_schema="Object",
-            json_schema=json_schema,
+            json_schema=_object_json_schema(obj),
         )
     
     def _map_scaled_decimal(
@@ -348,15 +358,13 @@ class DTDLTypeMapper:
         Returns:
             TypeMappingResult with mapping details
         """
-        json_schema = DTDLScaledDecimal.get_json_schema()
-        
         return TypeMappingResult(
             fabric_type=FabricValueType.STRING,
             is_complex=True,
             semantic_type=semantic_type,
             unit=unit,
             original_schema="scaledDecimal",
-            json_schema=json_schema,
+            json_schema=DTDLScaledDecimal.get_json_schema(),
         )
     
     def generate_documentation(
@@ -395,6 +403,10 @@ class DTDLTypeMapper:
         return "\n".join(lines)
 
 
+# Stateless mapper shared by the module-level helpers below
+_DEFAULT_MAPPER = DTDLTypeMapper()
+
+
 def flatten_object_fields(obj: DTDLObject, prefix: str = "") -> List[Dict[str, Any]]:
     """
     Flatten a DTDL Object into a list of property definitions.
@@ -409,12 +421,11 @@ def flatten_object_fields(obj: DTDLObject, prefix: str = "") -> List[Dict[str, A
     Returns:
         List of property definitions with name and fabric_type
     """
-    mapper = DTDLTypeMapper()
     properties = []
     
     for field in obj.fields:
         field_name = f"{prefix}_{field.name}" if prefix else field.name
-        mapping = mapper.map_schema(field.schema)
+        mapping = _DEFAULT_MAPPER.map_schema(field.schema)
         
         properties.append({
             "name": field_name,
@@ -11,7 +11,8 @@ https://github.com/Azure/opendigitaltwins-dtdl/blob/master/DTDL/v4/DTDL.v4.md
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional
+from functools import lru_cache
+from typing import Dict, List, Set, Optional, Tuple
 from enum import Enum
 
 from .dtdl_models import (
@@ -28,6 +29,28 @@ from .dtdl_models import (
 logger = logging.getLogger(__name__)
 
 
+# DTMI format: dtmi:<path>;<version> where path is segments separated by colons.
+# The grammar is regular and every repetition is anchored on a delimiter, so a
+# single full match is linear in the length of the string.
+DTMI_PATTERN = re.compile(
+    r'^dtmi:'  # Scheme
+    r'[A-Za-z][A-Za-z0-9_]*'  # First path segment
+    r'(?::[A-Za-z_][A-Za-z0-9_]*)*'  # Additional path segments
+    r'(?:;[1-9][0-9]{0,8}(?:\.[1-9][0-9]{0,5})?)?\Z'  # Optional version
+)
+
+
+@lru_cache(maxsize=4096)
+def is_valid_dtmi(dtmi: str) -> bool:
+    """
+    Check whether a string is a syntactically valid DTMI.
+    
+    Results are cached because the same DTMIs recur across extends lists,
+    relationship targets and component schemas.
+    """
+    return DTMI_PATTERN.match(dtmi) is not None
+
+
 class ValidationLevel(Enum):
     """Severity level of validation issues."""
     ERROR = "error"
@@ -138,14 +161,8 @@ class DTDLValidator:
                 print(error)
     """
     
-    # DTMI format regex
-    # Format: dtmi:<path>;<version> where path is segments separated by colons
-    DTMI_PATTERN = re.compile(
-        r'^dtmi:'  # Scheme
-        r'[A-Za-z][A-Za-z0-9_]*'  # First path segment
-        r'(:[A-Za-z_][A-Za-z0-9_]*)*'  # Additional path segments
-        r'(;[1-9][0-9]{0,8}(\.[1-9][0-9]{0,5})?)?$'  # Optional version
-    )
+    # DTMI format regex (see module-level DTMI_PATTERN)
+    DTMI_PATTERN = DTMI_PATTERN
     
     # Property/content name pattern
     NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*[A-Za-z0-9]?$')
@@ -189,6 +206,25 @@ class DTDLValidator:
         Returns:
             ValidationResult with all errors and warnings
         """
+        return self.validate_indexed(interfaces)[0]
+    
+    def validate_indexed(
+        self,
+        interfaces: List[DTDLInterface]
+    ) -> Tuple[ValidationResult, Dict[str, DTDLInterface]]:
+        """
+        Validate interfaces and also return the DTMI lookup table built on the way.
+        
+        The table maps each DTMI to its interface (last definition wins), which
+        is the same index the converter needs, so callers that validate and then
+        convert can build it only once.
+        
+        Args:
+            interfaces: List of parsed interfaces to validate
+            
+        Returns:
+            Tuple of (ValidationResult, DTMI -> interface mapping)
+        """
         result = ValidationResult()
         
         # Edge case: Empty input
@@ -197,7 +233,7 @@ class DTDLValidator:
                 level=ValidationLevel.WARNING,
                 message="No interfaces provided for validation",
             ))
-            return result
+            return result, {}
         
         # Edge case: Large ontology warning
         if len(interfaces) > 500:
@@ -237,7 +273,7 @@ class DTDLValidator:
             result.errors.extend(result.warnings)
             result.warnings = []
         
-        return result
+        return result, interface_by_dtmi
     
     def _validate_interface(
         self,
@@ -332,7 +368,7 @@ class DTDLValidator:
             ))
         
         # Check format
-        if not self.DTMI_PATTERN.match(dtmi):
+        if not is_valid_dtmi(dtmi):
             result.add(DTDLValidationError(
                 level=ValidationLevel.ERROR,
                 message=f"Invalid DTMI format: {dtmi}",
@@ -340,7 +376,7 @@ class DTDLValidator:
             ))
         
         # Check for reserved prefixes
-        if dtmi.startswith("dtmi:dtdl:") or dtmi.startswith("dtmi:standard:"):
+        if dtmi.startswith(("dtmi:dtdl:", "dtmi:standard:")):
             result.add(DTDLValidationError(
                 level=ValidationLevel.WARNING,
                 message=f"DTMI uses reserved prefix: {dtmi}",
@@ -13,8 +13,10 @@ These were extracted from dtdl_converter.py for better separation of concerns.
 import hashlib
 import json
 import logging
+import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.shared.models import (
@@ -27,6 +29,43 @@ from src.shared.models import (
 logger = logging.getLogger(__name__)
 
 
+# Characters that are neither alphanumeric nor '_'. For str patterns \w is
+# exactly str.isalnum() plus '_', so this matches the Unicode rules below.
+_INVALID_NAME_CHARS = re.compile(r"\W")
+
+
+@lru_cache(maxsize=8192)
+def sanitize_name(name: str) -> str:
+    """
+    Sanitize a name to meet Fabric requirements.
+    
+    Fabric names must be alphanumeric with underscores,
+    start with a letter, and be <= 90 characters.
+    
+    Args:
+        name: Original name
+        
+    Returns:
+        Sanitized name
+    """
+    if not name:
+        return "Entity"
+    
+    # Replace invalid characters with underscore; names that are already
+    # valid (the common case) skip the per-character pass
+    if name.replace('_', '').isalnum():
+        sanitized = name
+    else:
+        sanitized = _INVALID_NAME_CHARS.sub('_', name)
+    
+    # Ensure starts with letter
+    if not sanitized[0].isalpha():
+        sanitized = 'E_' + sanitized
+    
+    # Truncate to max length
+    return sanitized[:90]
+
+
 class ComponentMode(str, Enum):
     """Component handling modes for DTDL to Fabric conversion."""
     FLATTEN = "flatten"  # Flatten properties into parent entity (legacy)
@@ -120,14 +159,8 @@ class ComponentConverter:
         self._id_generator = id_generator
         self._name_sanitizer = name_sanitizer or self._default_sanitize
     
-    def _default_sanitize(self, name: str) -> str:
-        """Default name sanitization."""
-        if not name:
-            return "Entity"
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
-        if not sanitized[0].isalpha():
-            sanitized = 'E_' + sanitized
-        return sanitized[:90]
+    # Default name sanitization (cached, shared with DTDLToFabricConverter)
+    _default_sanitize = staticmethod(sanitize_name)
     
     def _create_property_id(self, base_id: str, property_name: str) -> str:
         """Create a unique property ID."""
@@ -191,7 +224,7 @@ class ComponentConverter:
                 stub_entity_id = self._id_generator()
             
             # Extract name from schema DTMI
-            schema_name = component.schema.replace("dtmi:", "").split(";")[0].split(":")[-1]
+            schema_name = component.schema.partition(";")[0].rpartition(":")[2]
             
             stub_entity = EntityType(
                 id=stub_entity_id,
@@ -304,14 +337,8 @@ class CommandConverter:
         self._id_generator = id_generator
         self._name_sanitizer = name_sanitizer or self._default_sanitize
     
-    def _default_sanitize(self, name: str) -> str:
-        """Default name sanitization."""
-        if not name:
-            return "Entity"
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
-        if not sanitized[0].isalpha():
-            sanitized = 'E_' + sanitized
-        return sanitized[:90]
+    # Default name sanitization (cached, shared with DTDLToFabricConverter)
+    _default_sanitize = staticmethod(sanitize_name)
     
     def _create_property_id(self, base_id: str, property_name: str) -> str:
         """Create a unique property ID."""
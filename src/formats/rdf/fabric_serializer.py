@@ -10,6 +10,7 @@ Extracted from rdf_converter.py for Single Responsibility Principle.
 import base64
 import json
 import logging
+from collections import deque
 from typing import Dict, List, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -146,12 +147,12 @@ class FabricSerializer:
                 children[entity.baseEntityTypeId].append(entity.id)
         
         # Start with root entities (no parent)
-        queue = [e.id for e in entity_types if in_degree[e.id] == 0]
+        queue = deque(e.id for e in entity_types if in_degree[e.id] == 0)
         sorted_entities: List['EntityType'] = []
         visited: set = set()
         
         while queue:
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
             if current_id in visited:
                 continue
             visited.add(current_id)
@@ -23,6 +23,7 @@ Architecture:
 """
 
 import logging
+from collections import deque
 from pathlib import Path
 from typing import (
     Dict, List, Any, Optional, Tuple, Union, 
@@ -510,10 +511,10 @@ def _topological_sort_entities(entity_types: List[EntityType]) -> List[EntityTyp
     # BFS to build sorted order
     sorted_entities = []
     visited = set()
-    queue = [e.id for e in roots]
+    queue = deque(e.id for e in roots)
     
     while queue:
-        entity_id = queue.pop(0)
+        entity_id = queue.popleft()
         if entity_id in visited:
             continue
         visited.add(entity_id)
@@ -10,6 +10,8 @@ Components:
 """
 
 import logging
+import os
+import time
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -26,6 +28,21 @@ except ImportError:
     PSUTIL_AVAILABLE = False
 
 
+# Non-ASCII text is measured in slices of this many characters so that the
+# temporary UTF-8 copy stays small
+_SIZE_CHUNK_CHARS = 1 << 20
+
+
+def _utf8_size_bytes(text: str) -> int:
+    """Return the UTF-8 encoded length of ``text`` without encoding it whole."""
+    if text.isascii():
+        return len(text)
+    return sum(
+        len(text[start:start + _SIZE_CHUNK_CHARS].encode('utf-8'))
+        for start in range(0, len(text), _SIZE_CHUNK_CHARS)
+    )
+
+
 class MemoryManager:
     """
     Manage memory usage during RDF parsing to prevent out-of-memory crashes.
@@ -48,11 +65,22 @@ class MemoryManager:
     
     LOAD_FACTOR = 0.7  # Only use 70% of available memory as safe threshold
     
-    @staticmethod
-    def get_available_memory_mb() -> float:
+    # Readings of available memory are reused for this many seconds
+    AVAILABLE_MEMORY_TTL_S = 0.1
+    
+    # psutil handle for the current process and the last
+    # (monotonic time, available MB) reading, both filled on first use
+    _process = None
+    _available_sample: Optional[Tuple[float, float]] = None
+    
+    @classmethod
+    def get_available_memory_mb(cls) -> float:
         """
         Get available system memory in MB.
         
+        Readings younger than AVAILABLE_MEMORY_TTL_S are reused, so back-to-back
+        checks and status logs cost a single /proc read.
+        
         Returns:
             Available memory in MB, or infinity if detection fails.
         """
@@ -60,16 +88,22 @@ class MemoryManager:
             logger.warning("psutil not available - cannot check memory. Install with: pip install psutil")
             return float('inf')  # Assume unlimited if we can't check
         
+        now = time.monotonic()
+        sample = cls._available_sample
+        if sample is not None and now - sample[0] < cls.AVAILABLE_MEMORY_TTL_S:
+            return sample[1]
+        
         try:
             mem_info = psutil.virtual_memory()
             available_mb = mem_info.available / (1024 * 1024)
-            return available_mb
         except Exception as e:
             logger.warning(f"Could not determine available memory: {e}")
-            return MemoryManager.MIN_AVAILABLE_MB
+            return cls.MIN_AVAILABLE_MB
+        cls._available_sample = (now, available_mb)
+        return available_mb
     
-    @staticmethod
-    def get_memory_usage_mb() -> float:
+    @classmethod
+    def get_memory_usage_mb(cls) -> float:
         """
         Get current process memory usage in MB.
         
@@ -80,7 +114,10 @@ class MemoryManager:
             return 0.0
         
         try:
-            process = psutil.Process()
+            process = cls._process
+            # A forked child must not reuse its parent's handle
+            if process is None or process.pid != os.getpid():
+                process = cls._process = psutil.Process()
             return process.memory_info().rss / (1024 * 1024)
         except Exception:
             return 0.0
@@ -158,7 +195,8 @@ class MemoryManager:
         Args:
             context: Optional context string to include in log message.
         """
-        if not PSUTIL_AVAILABLE:
+        # Skip the psutil reads entirely when the message would be dropped
+        if not PSUTIL_AVAILABLE or not logger.isEnabledFor(logging.DEBUG):
             return
         
         try:
@@ -241,6 +279,10 @@ class RDFGraphParser:
         """Normalize user-provided format/alias to an rdflib format."""
         if not rdf_format:
             return None
+        # Canonical names and lowercase aliases (the common case) map directly
+        normalized = cls.FORMAT_ALIASES.get(rdf_format)
+        if normalized is not None:
+            return normalized
         fmt = rdf_format.strip().lower()
         return cls.FORMAT_ALIASES.get(fmt, fmt)
 
@@ -277,6 +319,19 @@ class RDFGraphParser:
         """Return True when the serialization may contain multiple named graphs."""
         return format_name in cls.DATASET_FORMATS
 
+    @staticmethod
+    def _count_contexts(graph: Graph) -> int:
+        """
+        Count the named graphs in a parsed dataset, or 0 if that fails.
+        
+        The store yields each context once, so they are counted as they
+        stream past rather than collected into a set of identifiers.
+        """
+        try:
+            return sum(1 for _ in graph.contexts())
+        except Exception:
+            return 0
+
     @classmethod
     def _create_graph(cls, format_name: str) -> Graph:
         """Instantiate the correct rdflib graph implementation for a format."""
@@ -285,40 +340,15 @@ class RDFGraphParser:
         return Graph()
     
     @staticmethod
-    def parse_ttl_content(
-        ttl_content: str,
-        force_large_file: bool = False,
-        rdf_format: Optional[str] = None,
-        source_path: Optional[Union[str, Path]] = None,
-    ) -> Tuple[Graph, int, float]:
+    def _check_memory(size_mb: float, force_large_file: bool) -> None:
         """
-        Parse RDF content into an RDF graph with memory safety checks.
+        Run the pre-flight memory check for ``size_mb`` of RDF input.
         
-        Args:
-            ttl_content: The RDF content as a string
-            force_large_file: If True, skip memory safety checks for large files
-            rdf_format: Optional explicit serialization name/alias
-            source_path: Optional source path used for format inference
-            
-        Returns:
-            Tuple of (parsed Graph, triple count, content size in MB)
-            
         Raises:
-            ValueError: If TTL content is empty or has invalid syntax
-            MemoryError: If insufficient memory is available to parse the file
+            MemoryError: If insufficient memory is available
         """
-        logger.info("Parsing RDF content%s...", f" ({rdf_format})" if rdf_format else "")
-        
-        if not ttl_content or not ttl_content.strip():
-            raise ValueError("Empty TTL content provided")
-        
-        # Check size before parsing
-        content_size_mb = len(ttl_content.encode('utf-8')) / (1024 * 1024)
-        logger.info(f"RDF content size: {content_size_mb:.2f} MB")
-        
-        # Pre-flight memory check to prevent crashes
         can_proceed, memory_message = MemoryManager.check_memory_available(
-            content_size_mb, 
+            size_mb, 
             force=force_large_file
         )
         
@@ -327,32 +357,55 @@ class RDFGraphParser:
             raise MemoryError(memory_message)
         
         logger.info(f"Memory check: {memory_message}")
+    
+    @staticmethod
+    def _parse_into_graph(
+        source: Optional[str],
+        format_name: str,
+        size_mb: float,
+        source_kind: str,
+        data: Optional[str] = None,
+        graph: Optional[Graph] = None,
+        require_triples: bool = True,
+    ) -> Tuple[Graph, int]:
+        """
+        Parse RDF into a graph with the shared error handling and logging.
         
-        if content_size_mb > 100:
-            logger.warning(
-                f"Large RDF content detected ({content_size_mb:.1f} MB). "
-                "Parsing may take several minutes."
-            )
-        
+        Args:
+            source: File path to parse (None when ``data`` is given)
+            format_name: Resolved rdflib serialization name
+            size_mb: Input size in MB, used in log and error messages
+            source_kind: "content" or "file", used in messages
+            data: RDF document as a string, instead of ``source``
+            graph: Graph to parse into; a new in-memory graph if omitted
+            require_triples: If True, raise ValueError when nothing was parsed
+            
+        Returns:
+            Tuple of (parsed Graph, triple count)
+            
+        Raises:
+            ValueError: If the input has invalid syntax or contains no triples
+            MemoryError: If the process runs out of memory while parsing
+        """
         # Log memory before parsing
         MemoryManager.log_memory_status("Before parsing")
         
-        # Determine serialization format
-        format_name = RDFGraphParser.resolve_format(rdf_format, source_path)
-
-        # Parse the RDF content
-        graph = RDFGraphParser._create_graph(format_name)
+        if graph is None:
+            graph = RDFGraphParser._create_graph(format_name)
         try:
-            graph.parse(data=ttl_content, format=format_name)
+            if data is not None:
+                graph.parse(data=data, format=format_name)
+            else:
+                graph.parse(source, format=format_name)
         except MemoryError as e:
             MemoryManager.log_memory_status("After MemoryError")
             raise MemoryError(
-                f"Insufficient memory while parsing RDF content ({content_size_mb:.1f} MB). "
+                f"Insufficient memory while parsing RDF {source_kind} ({size_mb:.1f} MB). "
                 f"Try splitting the ontology into smaller files or increasing available memory. "
                 f"Original error: {e}"
             )
         except Exception as e:
-            logger.error(f"Failed to parse RDF content: {e}")
+            logger.error(f"Failed to parse RDF {source_kind}: {e}")
             raise ValueError(f"Invalid RDF/TTL syntax: {e}")
         
         # Log memory after parsing
@@ -360,22 +413,67 @@ class RDFGraphParser:
         
         triple_count = len(graph)
         if RDFGraphParser._is_dataset_format(format_name):
-            try:
-                context_count = len({ctx.identifier for ctx in graph.contexts()})
-            except Exception:
-                context_count = 0
+            context_count = RDFGraphParser._count_contexts(graph)
             logger.info(
                 f"Successfully parsed dataset with {triple_count} quads "
                 f"across {context_count or 'unknown'} graph contexts "
-                f"({content_size_mb:.1f} MB)"
+                f"({size_mb:.1f} MB)"
             )
         else:
             logger.info(
-                f"Successfully parsed {triple_count} triples ({content_size_mb:.1f} MB)"
+                f"Successfully parsed {triple_count} triples ({size_mb:.1f} MB)"
             )
-        if triple_count == 0:
+        if require_triples and triple_count == 0:
             logger.warning("Parsed graph is empty - no triples found")
             raise ValueError("No RDF triples found in the provided content")
+        
+        return graph, triple_count
+    
+    @staticmethod
+    def parse_ttl_content(
+        ttl_content: str,
+        force_large_file: bool = False,
+        rdf_format: Optional[str] = None,
+        source_path: Optional[Union[str, Path]] = None,
+    ) -> Tuple[Graph, int, float]:
+        """
+        Parse RDF content into an RDF graph with memory safety checks.
+        
+        Args:
+            ttl_content: The RDF content as a string
+            force_large_file: If True, skip memory safety checks for large files
+            rdf_format: Optional explicit serialization name/alias
+            source_path: Optional source path used for format inference
+            
+        Returns:
+            Tuple of (parsed Graph, triple count, content size in MB)
+            
+        Raises:
+            ValueError: If TTL content is empty or has invalid syntax
+            MemoryError: If insufficient memory is available to parse the file
+        """
+        logger.info("Parsing RDF content%s...", f" ({rdf_format})" if rdf_format else "")
+        
+        if not ttl_content or not ttl_content.strip():
+            raise ValueError("Empty TTL content provided")
+        
+        # Check size before parsing
+        content_size_mb = _utf8_size_bytes(ttl_content) / (1024 * 1024)
+        logger.info(f"RDF content size: {content_size_mb:.2f} MB")
+        
+        # Pre-flight memory check to prevent crashes
+        RDFGraphParser._check_memory(content_size_mb, force_large_file)
+        
+        if content_size_mb > 100:
+            logger.warning(
+                f"Large RDF content detected ({content_size_mb:.1f} MB). "
+                "Parsing may take several minutes."
+            )
+        
+        format_name = RDFGraphParser.resolve_format(rdf_format, source_path)
+        graph, triple_count = RDFGraphParser._parse_into_graph(
+            None, format_name, content_size_mb, "content", data=ttl_content
+        )
 
         if triple_count > 100000:
             logger.warning(
@@ -407,63 +505,21 @@ class RDFGraphParser:
             ValueError: If file has invalid syntax
             MemoryError: If insufficient memory is available
         """
-        path = Path(file_path)
-        if not path.exists():
+        # One stat call both checks existence and gives the size
+        try:
+            file_size_bytes = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        file_size_mb = path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_size_bytes / (1024 * 1024)
         logger.info(f"File size: {file_size_mb:.2f} MB")
         
         # Pre-flight memory check
-        can_proceed, memory_message = MemoryManager.check_memory_available(
-            file_size_mb, 
-            force=force_large_file
-        )
-        
-        if not can_proceed:
-            logger.error(f"Memory check failed: {memory_message}")
-            raise MemoryError(memory_message)
-        
-        logger.info(f"Memory check: {memory_message}")
-        
-        # Log memory before parsing
-        MemoryManager.log_memory_status("Before parsing")
-        
-        # Resolve serialization format
-        format_name = RDFGraphParser.resolve_format(rdf_format, path)
-
-        # Parse the RDF file
-        graph = RDFGraphParser._create_graph(format_name)
-        try:
-            graph.parse(file_path, format=format_name)
-        except MemoryError as e:
-            MemoryManager.log_memory_status("After MemoryError")
-            raise MemoryError(
-                f"Insufficient memory while parsing RDF file ({file_size_mb:.1f} MB). "
-                f"Try splitting the ontology into smaller files or increasing available memory. "
-                f"Original error: {e}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to parse RDF file: {e}")
-            raise ValueError(f"Invalid RDF/TTL syntax: {e}")
+        RDFGraphParser._check_memory(file_size_mb, force_large_file)
         
-        # Log memory after parsing
-        MemoryManager.log_memory_status("After parsing")
-        
-        triple_count = len(graph)
-        if RDFGraphParser._is_dataset_format(format_name):
-            try:
-                context_count = len({ctx.identifier for ctx in graph.contexts()})
-            except Exception:
-                context_count = 0
-            logger.info(
-                f"Successfully parsed dataset with {triple_count} quads "
-                f"across {context_count or 'unknown'} graph contexts "
-                f"({file_size_mb:.1f} MB)"
-            )
-        else:
-            logger.info(
-                f"Successfully parsed {triple_count} triples ({file_size_mb:.1f} MB)"
-            )
+        format_name = RDFGraphParser.resolve_format(rdf_format, Path(file_path))
+        graph, triple_count = RDFGraphParser._parse_into_graph(
+            file_path, format_name, file_size_mb, "file", require_triples=False
+        )
         
         return graph, triple_count, file_size_mb
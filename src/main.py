@@ -40,34 +40,26 @@ Architecture:
 import sys
 
 # CLI lives under the app namespace
-from .app.cli import (
-    create_argument_parser,
-    ValidateCommand,
-    ConvertCommand,
-    UploadCommand,
-    ExportCommand,
-    ListCommand,
-    GetCommand,
-    DeleteCommand,
-    TestCommand,
-    CompareCommand,
-)
+from .app import cli
+from .app.cli import create_argument_parser
 
 
-# Command mapping from command name to Command class
+# Command mapping from command name to Command class name. Classes are looked
+# up on the cli package at dispatch time, which imports only the module of
+# the command being run.
 COMMAND_MAP = {
     # Unified commands (require --format)
-    'validate': ValidateCommand,
-    'convert': ConvertCommand,
-    'upload': UploadCommand,
-    'export': ExportCommand,
+    'validate': 'ValidateCommand',
+    'convert': 'ConvertCommand',
+    'upload': 'UploadCommand',
+    'export': 'ExportCommand',
     
     # Common commands (no format needed)
-    'list': ListCommand,
-    'get': GetCommand,
-    'delete': DeleteCommand,
-    'test': TestCommand,
-    'compare': CompareCommand,
+    'list': 'ListCommand',
+    'get': 'GetCommand',
+    'delete': 'DeleteCommand',
+    'test': 'TestCommand',
+    'compare': 'CompareCommand',
 }
 
 
@@ -87,13 +79,15 @@ def main():
         sys.exit(1)
     
     # Get the command class and instantiate it
-    command_class = COMMAND_MAP.get(args.command)
+    command_class_name = COMMAND_MAP.get(args.command)
     
-    if command_class is None:
+    if command_class_name is None:
         print(f"Error: Unknown command '{args.command}'")
         parser.print_help()
         sys.exit(1)
     
+    command_class = getattr(cli, command_class_name)
+    
     # Create and execute the command
     # Pass config_path if available in args
     config_path = getattr(args, 'config', None)
@@ -392,7 +392,7 @@ class OntologyPlugin(ABC):
         """
         pass
 
-    def create_pipeline(self) -> FormatPipeline:
+    def create_pipeline(self) -> "FormatPipeline":
         """Return a ready-to-use pipeline description for this format."""
         from formats.base import FormatPipeline  # Local import to avoid circular dependency
 
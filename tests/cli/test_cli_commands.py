@@ -634,3 +634,53 @@ class TestStreamingConverter:
         assert stats['classes_found'] == 50
         assert 'entities_created' in stats
         assert stats['entities_created'] == 50
+
+
+class TestCLIDispatch:
+    """Tests for command dispatch in main.py."""
+    
+    def test_command_map_resolves_every_command(self):
+        """Every CLI command name maps to a command class."""
+        from src.main import COMMAND_MAP, cli
+        from src.app.cli.commands.base import BaseCommand
+        
+        parser = cli.create_argument_parser()
+        subparsers = next(
+            a for a in parser._actions if getattr(a, "choices", None) and "list" in a.choices
+        )
+        
+        assert set(COMMAND_MAP) == set(subparsers.choices)
+        for class_name in COMMAND_MAP.values():
+            assert issubclass(getattr(cli, class_name), BaseCommand)
+    
+    def test_command_modules_imported_on_demand(self):
+        """Importing main does not import the command implementations."""
+        import subprocess
+        import sys
+        
+        root = Path(__file__).resolve().parents[2]
+        code = (
+            "import sys, src.main as m; "
+            "print(sorted(n for n in sys.modules if n.startswith('src.app.cli.commands.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        
+        assert output == "['src.app.cli.commands.base']"
+    
+    def test_cli_startup_does_not_import_rdflib(self):
+        """The src package exports RDF and client APIs lazily."""
+        import subprocess
+        import sys
+        
+        root = Path(__file__).resolve().parents[2]
+        code = (
+            "import sys, src.main; "
+            "print('rdflib' in sys.modules, 'src.core' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        
+        assert output == "False False"
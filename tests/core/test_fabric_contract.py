@@ -42,6 +42,7 @@ from tests.fixtures.fabric_responses import (
 from src.core.validators.fabric_schema import (
     FabricSchemaValidator,
     validate_fabric_definition,
+    validate_fabric_definitions,
 )
 
 
@@ -385,6 +386,66 @@ class TestUpdateDefinitionContract:
         # Assert
         assert result.is_valid, f"Validation errors: {result.errors}"
         assert len(result.errors) == 0
+    
+    def test_strict_mode_promotes_warnings_to_errors(self):
+        """Verify strict mode reports warnings as errors and fails validation."""
+        # Arrange: Empty parts only produces a warning
+        definition = {"parts": []}
+        
+        # Act
+        lenient = FabricSchemaValidator().validate(definition)
+        strict = FabricSchemaValidator(strict=True).validate(definition)
+        
+        # Assert
+        assert lenient.is_valid
+        assert lenient.warnings
+        assert not strict.is_valid
+        assert strict.errors == lenient.warnings
+        assert strict.warnings == []
+    
+    def test_batch_validation_matches_single_validation(self):
+        """Verify batch validation returns per-definition errors in input order."""
+        # Arrange
+        valid_definition = create_sample_definition(entity_count=2, relationship_count=1)
+        invalid_definition = {"parts": "not-a-list"}
+        
+        # Act
+        batch_errors = validate_fabric_definitions([valid_definition, invalid_definition])
+        
+        # Assert
+        assert batch_errors == [
+            validate_fabric_definition(valid_definition),
+            validate_fabric_definition(invalid_definition),
+        ]
+        assert batch_errors[0] == []
+        assert batch_errors[1]
+    
+    def test_explicit_null_fields_are_still_validated(self, schema_validator):
+        """Verify keys set to null are checked, not treated as absent."""
+        # Arrange: valueType and visibility present but null
+        definition = {
+            "parts": [
+                {
+                    "path": "EntityTypes/Nulls.json",
+                    "payload": base64.b64encode(json.dumps({
+                        "id": "1000000000001",
+                        "name": "Nulls",
+                        "namespace": "usertypes",
+                        "namespaceType": "Custom",
+                        "visibility": None,
+                        "properties": [{"id": "10", "name": "p", "valueType": None}],
+                    }).encode()).decode(),
+                    "payloadType": "InlineBase64"
+                }
+            ]
+        }
+        
+        # Act
+        result = schema_validator.validate(definition)
+        
+        # Assert
+        assert any("Invalid visibility 'None'" in e for e in result.errors)
+        assert any("Invalid valueType 'None'" in e for e in result.errors)
 
 
 # =============================================================================
@@ -495,6 +495,34 @@ class TestEntityIdPartsInferrer:
         
         parts = entity_inferrer.infer_entity_id_parts(entity)
         assert parts == ["102"]
+    
+    def test_infer_sees_same_length_property_edit(self, entity_inferrer):
+        """Replacing a property in place is picked up by the next inference."""
+        entity = EntityType(
+            id="1",
+            name="TestEntity",
+            properties=[EntityTypeProperty(id="10", name="id", valueType="String")],
+        )
+        assert entity_inferrer.infer_entity_id_parts(entity) == ["10"]
+        
+        entity.properties[0] = EntityTypeProperty(id="11", name="id", valueType="String")
+        assert entity_inferrer.infer_entity_id_parts(entity) == ["11"]
+    
+    def test_shared_property_index(self, entity_inferrer):
+        """One index can serve both id-part inference and display name selection."""
+        entity = EntityType(
+            id="1",
+            name="TestEntity",
+            properties=[
+                EntityTypeProperty(id="100", name="id", valueType="BigInt"),
+                EntityTypeProperty(id="101", name="label", valueType="String"),
+            ],
+        )
+        index = entity_inferrer.index_properties(entity.properties)
+        
+        entity.entityIdParts = entity_inferrer.infer_entity_id_parts(entity, index)
+        assert entity.entityIdParts == ["100"]
+        assert entity_inferrer.set_display_name_property(entity, index) == "101"
 
 
 # =============================================================================
@@ -8,6 +8,7 @@ Tests cover:
 - Type mapping
 """
 
+import dataclasses
 import json
 import pytest
 import tempfile
@@ -179,6 +180,96 @@ class TestDTDLParser:
             result = parser.parse_directory(tmpdir)
             
             assert len(result.interfaces) == 2
+    
+    def test_parse_directory_parallel_matches_sequential(self, parser, tmp_path):
+        """Parsing in a process pool yields the same ordered result."""
+        for i in range(4):
+            (tmp_path / f"device{i}.json").write_text(json.dumps({
+                "@context": "dtmi:dtdl:context;4",
+                "@id": f"dtmi:com:example:Device{i};1",
+                "@type": "Interface",
+                "contents": [{"@type": "Property", "name": "temp", "schema": "double"}]
+            }))
+        (tmp_path / "broken.json").write_text("{")
+        
+        sequential = parser.parse_directory(tmp_path)
+        parallel = parser.parse_directory(tmp_path, max_workers=2)
+        
+        assert [i.dtmi for i in parallel.interfaces] == [i.dtmi for i in sequential.interfaces]
+        assert len(parallel.interfaces) == 4
+        assert [str(e) for e in parallel.errors] == [str(e) for e in sequential.errors]
+        assert parallel.files_parsed == sequential.files_parsed
+        
+        # Worker results are re-interned, so names are shared across interfaces
+        names = [i.contents[0].name for i in parallel.interfaces]
+        assert all(name is names[0] for name in names)
+        assert parallel.interfaces[0].dtmi is sys.intern("dtmi:com:example:Device0;1")
+    
+    def test_parse_directory_in_process_by_default(self, parser, tmp_path, monkeypatch):
+        """No process pool is started unless max_workers is passed."""
+        module = sys.modules[DTDLParser.__module__]
+        
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used without max_workers")
+        
+        monkeypatch.setattr(module, "ProcessPoolExecutor", no_pool)
+        for i in range(3):
+            (tmp_path / f"device{i}.json").write_text(json.dumps({
+                "@context": "dtmi:dtdl:context;4",
+                "@id": f"dtmi:com:example:Device{i};1",
+                "@type": "Interface",
+            }))
+        
+        assert len(parser.parse_directory(tmp_path).interfaces) == 3
+    
+    def test_parse_file_utf8_and_invalid_json(self, parser):
+        """Files are decoded as UTF-8; malformed JSON is reported, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "café.json"
+            good.write_text(json.dumps({
+                "@context": "dtmi:dtdl:context;4",
+                "@id": "dtmi:com:example:Cafe;1",
+                "@type": "Interface",
+                "displayName": "Café",
+                "contents": []
+            }, ensure_ascii=False), encoding='utf-8')
+            bad = Path(tmpdir) / "bad.json"
+            bad.write_text("{not json", encoding='utf-8')
+            
+            result = parser.parse_file(good)
+            assert result.interfaces[0].display_name == "Café"
+            
+            result = parser.parse_file(bad)
+            assert not result.interfaces
+            assert result.errors[0].message.startswith("Invalid JSON")
+    
+    def test_json_backends_encode_identically(self, monkeypatch):
+        """The stdlib fallback emits the same bytes as orjson for definition payloads."""
+        import importlib
+        import formats.dtdl._json as dtdl_json
+        
+        value = {"n": "café", "k": ["∑", 1]}
+        expected = b'{"n":"caf\xc3\xa9","k":["\xe2\x88\x91",1]}'
+        part = {
+            "id": "1000000000001", "name": "Pompe_à_eau", "visibility": "Visible",
+            "baseEntityTypeId": None, "entityIdParts": ["10000000000011"],
+            "properties": [{"id": "10000000000011", "valueType": "BigInt", "max": 2 ** 63 - 1}],
+            "scale": -0.125, "flags": [True, False],
+        }
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        try:
+            fallback = importlib.reload(dtdl_json)
+            assert not fallback.ORJSON_AVAILABLE
+            assert fallback.dumps_bytes(value) == expected
+            assert fallback.dumps(value) == expected.decode("utf-8")
+            fallback_part = fallback.dumps_bytes(part)
+        finally:
+            monkeypatch.undo()
+            importlib.reload(dtdl_json)
+        if dtdl_json.ORJSON_AVAILABLE:
+            assert dtdl_json.dumps_bytes(value) == expected
+            assert dtdl_json.dumps_bytes(part) == fallback_part
+        assert json.loads(fallback_part) == part
 
 
 class TestDTDLValidator:
@@ -223,6 +314,17 @@ class TestDTDLValidator:
         assert not result.is_valid
         assert any("DTMI" in str(e.message) for e in result.errors)
     
+    def test_is_valid_dtmi(self):
+        """The DTMI check matches the whole string."""
+        from formats.dtdl import is_valid_dtmi
+        
+        assert is_valid_dtmi("dtmi:com:example:Thermostat;1")
+        assert is_valid_dtmi("dtmi:com:example:Thermostat;1.2")
+        assert is_valid_dtmi("dtmi:com:example:Thermostat")
+        assert not is_valid_dtmi("invalid:format")
+        assert not is_valid_dtmi("dtmi:com:example;0")
+        assert not is_valid_dtmi("dtmi:com:example;1\n")
+    
     def test_missing_extends_reference(self, validator):
         """Test validation catches missing extends reference."""
         interface = DTDLInterface(
@@ -268,6 +370,26 @@ class TestDTDLToFabricConverter:
         assert len(entity.properties) == 2
         assert len(entity.timeseriesProperties) == 1
     
+    def test_convert_with_validation(self, converter):
+        """Valid input is converted; invalid input stops after validation."""
+        interface = DTDLInterface(
+            dtmi="dtmi:com:example:Thermostat;1",
+            type="Interface",
+            display_name="Thermostat"
+        )
+        interface.properties = [DTDLProperty(name="temperature", schema="double")]
+        
+        result, validation = converter.convert_with_validation([interface])
+        
+        assert validation.is_valid
+        assert [e.name for e in result.entity_types] == ["Thermostat"]
+        
+        invalid = DTDLInterface(dtmi="invalid:format", type="Interface")
+        result, validation = converter.convert_with_validation([invalid])
+        
+        assert result is None
+        assert not validation.is_valid
+    
     def test_convert_interface_with_relationship(self, converter):
         """Test converting interfaces with relationships."""
         room = DTDLInterface(
@@ -321,6 +443,241 @@ class TestDTDLToFabricConverter:
         assert type_map["stringProp"] == "String"
         assert type_map["dateProp"] == "DateTime"
     
+    def test_convert_renames_conflict_with_grandparent(self, converter):
+        """A property conflicting with a grandparent's type gets a type suffix."""
+        base = DTDLInterface(dtmi="dtmi:com:example:Base;1", type="Interface")
+        base.properties = [DTDLProperty(name="level", schema="integer")]
+        middle = DTDLInterface(
+            dtmi="dtmi:com:example:Middle;1",
+            type="Interface",
+            extends=["dtmi:com:example:Base;1"]
+        )
+        leaf = DTDLInterface(
+            dtmi="dtmi:com:example:Leaf;1",
+            type="Interface",
+            extends=["dtmi:com:example:Middle;1"]
+        )
+        leaf.properties = [DTDLProperty(name="level", schema="string")]
+        
+        result = converter.convert([leaf, middle, base])
+        
+        names = {e.id: [p.name for p in e.properties] for e in result.entity_types}
+        assert names[converter.get_dtmi_mapping()[leaf.dtmi]] == ["level_string"]
+    
+    def test_topological_sort_parents_first_and_keeps_cycles(self, converter):
+        """Parents sort before children; interfaces in a cycle are appended."""
+        def iface(name, *parents):
+            return DTDLInterface(
+                dtmi=f"dtmi:com:example:{name};1",
+                type="Interface",
+                extends=[f"dtmi:com:example:{p};1" for p in parents]
+            )
+        
+        interfaces = [iface("Leaf", "Mid"), iface("Mid", "Root"), iface("Root"),
+                      iface("A", "B"), iface("B", "A")]
+        
+        ordered = [i.dtmi.split(":")[-1] for i in converter._topological_sort(interfaces)]
+        
+        assert ordered == ["Root;1", "Mid;1", "Leaf;1", "A;1", "B;1"]
+    
+    def test_topological_sort_keeps_duplicate_dtmis(self, converter):
+        """Every input interface is returned, including duplicate DTMIs."""
+        first = DTDLInterface(dtmi="dtmi:com:example:Dup;1", type="Interface")
+        second = DTDLInterface(dtmi="dtmi:com:example:Dup;1", type="Interface")
+        chain = [
+            DTDLInterface(
+                dtmi=f"dtmi:com:example:N{i};1",
+                type="Interface",
+                extends=[f"dtmi:com:example:N{i - 1};1"] if i else []
+            )
+            for i in range(2000)
+        ]
+        
+        ordered = converter._topological_sort([first] + chain[::-1] + [second])
+        
+        assert len(ordered) == 2002
+        assert [i for i in ordered if i.dtmi != first.dtmi] == chain
+        assert any(i is first for i in ordered) and any(i is second for i in ordered)
+    
+    def test_convert_with_compliance_report_can_skip_report(self, converter):
+        """generate_report=False returns the conversion without a report."""
+        interface = DTDLInterface(dtmi="dtmi:com:example:Test;1", type="Interface")
+        
+        result, report = converter.convert_with_compliance_report(
+            [interface], generate_report=False
+        )
+        
+        assert len(result.entity_types) == 1
+        assert report is None
+    
+    def test_scaled_decimal_mode_selects_string_schema_type(self):
+        """CALCULATED mode maps scaledDecimal to Double, also when set later."""
+        from src.dtdl import ScaledDecimalMode
+        
+        converter = DTDLToFabricConverter(scaled_decimal_mode=ScaledDecimalMode.CALCULATED)
+        assert converter._schema_to_fabric_type("scaledDecimal") == "Double"
+        assert converter._schema_to_fabric_type("integer") == "BigInt"
+        
+        converter.scaled_decimal_mode = ScaledDecimalMode.JSON_STRING
+        assert converter._schema_to_fabric_type("scaledDecimal") == "String"
+    
+    def test_structured_scaled_decimal_properties_follow_commands(self):
+        """STRUCTURED mode appends _scale/_value after command properties."""
+        from src.dtdl import CommandMode, DTDLCommand, ScaledDecimalMode
+        
+        converter = DTDLToFabricConverter(
+            command_mode=CommandMode.PROPERTY,
+            scaled_decimal_mode=ScaledDecimalMode.STRUCTURED,
+        )
+        interface = DTDLInterface(dtmi="dtmi:com:example:Meter;1", type="Interface")
+        interface.properties = [
+            DTDLProperty(name="reading", schema="scaledDecimal"),
+            DTDLProperty(name="label", schema="string"),
+        ]
+        interface.commands = [DTDLCommand(name="reset")]
+        
+        entity = converter.convert([interface]).entity_types[0]
+        
+        assert [p.name for p in entity.properties] == [
+            "reading", "label", "command_reset", "reading_scale", "reading_value"
+        ]
+        assert entity.properties[3].valueType == "BigInt"
+    
+    def test_command_entity_parameter_properties(self):
+        """ENTITY mode prefixes request/response parameters per payload."""
+        from src.dtdl import CommandMode, DTDLCommand, DTDLCommandPayload
+        from src.dtdl.dtdl_models import DTDLField
+        
+        converter = DTDLToFabricConverter(command_mode=CommandMode.ENTITY)
+        interface = DTDLInterface(dtmi="dtmi:com:example:Pump;1", type="Interface")
+        interface.commands = [DTDLCommand(
+            name="setSpeed",
+            request=DTDLCommandPayload(name="speed", schema=DTDLObject(fields=[
+                DTDLField(name="rpm", schema="integer"),
+                DTDLField(name="ramp", schema="double"),
+            ])),
+            response=DTDLCommandPayload(name="accepted", schema="boolean"),
+        )]
+        
+        result = converter.convert([interface])
+        
+        command = next(e for e in result.entity_types if e.name == "Command_setSpeed")
+        assert [(p.name, p.valueType) for p in command.properties] == [
+            ("commandName", "String"),
+            ("requestSchema", "String"),
+            ("request_rpm", "BigInt"),
+            ("request_ramp", "Double"),
+            ("responseSchema", "String"),
+            ("response_accepted", "Boolean"),
+        ]
+        assert command.properties[2].id == converter._create_property_id(
+            command.id, "request_rpm"
+        )
+    
+    def test_property_ids_are_stable(self, converter):
+        """Property IDs keep the MD5-derived 4-digit suffix."""
+        assert converter._create_property_id("1000", "temperature") == "10002775"
+        assert converter._create_property_id("2000", "temperature") == "20002775"
+    
+    def test_fabric_ids_ignore_version(self, converter):
+        """Fabric IDs are SHA-256 based and shared across DTMI versions."""
+        fabric_id = converter._get_or_create_fabric_id("dtmi:com:example:Room;1")
+        
+        assert fabric_id == "1000875289986"
+        assert converter._get_or_create_fabric_id("dtmi:com:example:Room;2") == fabric_id
+    
+    def test_flatten_component_uses_conversion_interface_map(self):
+        """FLATTEN mode resolves component schemas from the indexed interfaces."""
+        from src.dtdl import ComponentMode, DTDLComponent
+        
+        converter = DTDLToFabricConverter(component_mode=ComponentMode.FLATTEN)
+        sensor = DTDLInterface(dtmi="dtmi:com:example:Sensor;1", type="Interface")
+        sensor.properties = [DTDLProperty(name="reading", schema="double")]
+        pump = DTDLInterface(dtmi="dtmi:com:example:Pump;1", type="Interface")
+        pump.components = [
+            DTDLComponent(name="inlet", schema=sensor.dtmi),
+            DTDLComponent(name="outlet", schema=sensor.dtmi),
+        ]
+        
+        result = converter.convert([pump, sensor])
+        
+        entity = next(e for e in result.entity_types if e.name == "Pump")
+        assert [(p.name, p.valueType) for p in entity.properties] == [
+            ("inlet_reading", "Double"), ("outlet_reading", "Double")
+        ]
+        assert converter._interface_map[sensor.dtmi] is sensor
+    
+    def test_external_component_stub_emitted_once(self):
+        """Components sharing an external schema share one stub entity."""
+        from src.dtdl import ComponentMode, DTDLComponent
+        
+        converter = DTDLToFabricConverter(component_mode=ComponentMode.SEPARATE)
+        interfaces = []
+        for name in ("Pump", "Valve"):
+            interface = DTDLInterface(dtmi=f"dtmi:com:example:{name};1", type="Interface")
+            interface.components = [
+                DTDLComponent(name="sensor", schema="dtmi:com:external:Sensor;1")
+            ]
+            interfaces.append(interface)
+        
+        result = converter.convert(interfaces)
+        
+        stub_id = converter._get_or_create_fabric_id("dtmi:com:external:Sensor;1")
+        stubs = [e for e in result.entity_types if e.id == stub_id]
+        assert [e.name for e in stubs] == ["sensor_Sensor"]
+        assert len(result.relationship_types) == 2
+        assert all(r.target.entityTypeId == stub_id for r in result.relationship_types)
+    
+    def test_repeated_external_component_output_unchanged(self):
+        """Reusing a stub leaves the stub and each relationship as if converted alone."""
+        from src.dtdl import ComponentMode, DTDLComponent
+        
+        def make_interface(name):
+            interface = DTDLInterface(dtmi=f"dtmi:com:example:{name};1", type="Interface")
+            interface.components = [
+                DTDLComponent(name="sensor", schema="dtmi:com:external:Sensor;1")
+            ]
+            return interface
+        
+        def convert(names):
+            converter = DTDLToFabricConverter(component_mode=ComponentMode.SEPARATE)
+            result = converter.convert([make_interface(name) for name in names])
+            return [e.to_dict() for e in result.entity_types], [
+                r.to_dict() for r in result.relationship_types
+            ]
+        
+        entities, relationships = convert(["Pump", "Valve"])
+        pump_entities, pump_relationships = convert(["Pump"])
+        valve_entities, valve_relationships = convert(["Valve"])
+        
+        # Same entities as the separate runs, with the shared stub listed once
+        by_id = {e["id"]: e for e in pump_entities + valve_entities}
+        assert len(entities) == len(by_id) == 3
+        assert {e["id"]: e for e in entities} == by_id
+        assert relationships == pump_relationships + valve_relationships
+    
+    def test_iter_fabric_parts_matches_definition(self, converter):
+        """iter_fabric_parts yields the same parts as to_fabric_definition."""
+        interface = DTDLInterface(dtmi="dtmi:com:example:Test;1", type="Interface")
+        interface.properties = [DTDLProperty(name="label", schema="string")]
+        result = converter.convert([interface])
+        
+        parts = converter.iter_fabric_parts(result, "TestOntology")
+        
+        assert not isinstance(parts, list)
+        assert list(parts) == converter.to_fabric_definition(result, "TestOntology")["parts"]
+    
+    def test_fabric_limits_rechecked_after_result_changes(self, converter):
+        """Re-exporting a modified result validates the new contents."""
+        interface = DTDLInterface(dtmi="dtmi:com:example:Test;1", type="Interface")
+        result = converter.convert([interface])
+        converter.to_fabric_definition(result, "First")
+        
+        original = result.entity_types.pop()
+        result.entity_types.append(dataclasses.replace(original, name="x" * 300))
+        with pytest.raises(ValueError, match="Fabric API limit exceeded"):
+            converter.to_fabric_definition(result, "Second")
+    
     def test_to_fabric_definition(self, converter):
         """Test generating Fabric API definition format."""
         interface = DTDLInterface(
@@ -397,6 +754,70 @@ class TestDTDLTypeMapper:
         assert result.fabric_type == FabricValueType.DOUBLE
         assert result.semantic_type == "Temperature"
         assert result.unit == "degreeCelsius"
+    
+    def test_complex_mapping_json_schema_is_a_field(self, mapper):
+        """json_schema is a dataclass field, fixed at mapping time."""
+        from formats.dtdl.dtdl_models import DTDLField
+        
+        obj = DTDLObject(fields=[DTDLField(name="x", schema="double")])
+        result = mapper.map_schema(obj)
+        obj.fields.append(DTDLField(name="y", schema="double"))
+        
+        expected = result.json_schema
+        assert [f["name"] for f in expected["fields"]] == ["x"]
+        assert dataclasses.asdict(result)["json_schema"] == expected
+        assert dataclasses.replace(result, unit="m").json_schema == expected
+    
+    def test_flatten_shared_object_returns_fresh_rows(self):
+        """Flattening a shared Object schema twice yields equal, independent rows."""
+        from formats.dtdl import flatten_object_fields
+        from formats.dtdl.dtdl_models import DTDLField
+        
+        obj = DTDLObject(
+            fields=[DTDLField(name="x", schema="double"), DTDLField(name="label", schema="string")],
+            dtmi="dtmi:com:example:Point;1",
+        )
+        
+        first = flatten_object_fields(obj, prefix="pos")
+        first[0]["name"] = "mutated"
+        second = flatten_object_fields(obj, prefix="pos")
+        
+        assert [row["name"] for row in second] == ["pos_x", "pos_label"]
+        assert second[0]["fabric_type"] == FabricValueType.DOUBLE.value
+        assert flatten_object_fields(obj)[0]["name"] == "x"
+    
+    def test_flatten_redefined_object_uses_current_fields(self):
+        """A re-parsed Object with the same DTMI is flattened from its own fields."""
+        from formats.dtdl import flatten_object_fields
+        from formats.dtdl.dtdl_models import DTDLField
+        
+        dtmi = "dtmi:com:example:Pt;1"
+        before = DTDLObject(fields=[DTDLField(name="x", schema="integer")], dtmi=dtmi)
+        after = DTDLObject(
+            fields=[DTDLField(name="y", schema="string"), DTDLField(name="z", schema="double")],
+            dtmi=dtmi,
+        )
+        
+        assert [row["name"] for row in flatten_object_fields(before)] == ["x"]
+        assert [row["name"] for row in flatten_object_fields(after)] == ["y", "z"]
+    
+    def test_type_tables_are_read_only(self):
+        """The exported DTDL type tables cannot be mutated by callers."""
+        from formats.dtdl import PRIMITIVE_TYPE_MAP, DTDL_TO_FABRIC_TYPE
+        
+        assert PRIMITIVE_TYPE_MAP["integer"] == FabricValueType.BIG_INT
+        assert DTDL_TO_FABRIC_TYPE["integer"] == "BigInt"
+        with pytest.raises(TypeError):
+            PRIMITIVE_TYPE_MAP["integer"] = FabricValueType.STRING
+        with pytest.raises(TypeError):
+            DTDL_TO_FABRIC_TYPE["integer"] = "String"
+    
+    def test_fabric_value_types_are_interned(self):
+        """Every mapped value type is the interned string object."""
+        from formats.dtdl import DTDL_TO_FABRIC_TYPE
+        
+        for value_type in DTDL_TO_FABRIC_TYPE.values():
+            assert sys.intern(value_type) is value_type
 
 
 class TestIntegration:
@@ -642,10 +1063,32 @@ class TestDTDLv4Features:
             assert schema in GEOSPATIAL_SCHEMA_DTMIS
             assert GEOSPATIAL_SCHEMA_DTMIS[schema].endswith(";4")
     
+    def test_geospatial_schema_dtmi_set(self):
+        """Geospatial DTMIs support direct membership tests."""
+        from formats.dtdl import GEOSPATIAL_SCHEMA_DTMI_SET
+        
+        assert "dtmi:standard:schema:geospatial:point;4" in GEOSPATIAL_SCHEMA_DTMI_SET
+        assert "point" not in GEOSPATIAL_SCHEMA_DTMI_SET
+        assert len(GEOSPATIAL_SCHEMA_DTMI_SET) == len(GEOSPATIAL_SCHEMA_DTMIS)
+    
     def test_scaled_decimal_schema_dtmi(self):
         """Test that scaledDecimal schema DTMI is properly defined."""
         assert SCALED_DECIMAL_SCHEMA_DTMI == "dtmi:standard:schema:scaledDecimal;4"
     
+    def test_scaled_decimal_value_calculation(self):
+        """ScaledDecimalValue shifts by its scale and stays immutable."""
+        import math
+        from dataclasses import FrozenInstanceError
+        from src.formats.dtdl import ScaledDecimalValue
+        
+        assert ScaledDecimalValue(scale=7, value="1234.56").calculate_actual_value() == 12345600000.0
+        assert ScaledDecimalValue(scale=-2, value="150").calculate_actual_value() == 1.5
+        assert ScaledDecimalValue(scale=40, value="2").calculate_actual_value() == 2e40
+        assert math.isnan(ScaledDecimalValue(scale=0, value="abc").calculate_actual_value())
+        
+        with pytest.raises(FrozenInstanceError):
+            ScaledDecimalValue(scale=1, value="1").scale = 2
+    
     def test_primitive_schema_enum_includes_v4_types(self):
         """Test that DTDLPrimitiveSchema enum includes all v4 types."""
         v4_types = [
@@ -686,5 +1129,24 @@ class TestDTDLv4Features:
         assert validator.MAX_COMPLEX_SCHEMA_DEPTH == 8
 
 
+class TestPackageExports:
+    """Tests for the lazily resolved package API."""
+    
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves from its submodule."""
+        import formats.dtdl as package
+        
+        for name in package.__all__:
+            assert getattr(package, name) is not None, name
+        assert set(package.__all__) <= set(dir(package))
+    
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError rather than ImportError."""
+        import formats.dtdl as package
+        
+        with pytest.raises(AttributeError):
+            package.NotARealExport
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
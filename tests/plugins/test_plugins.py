@@ -356,6 +356,33 @@ class TestBuiltinPlugins:
         assert parser is not None
         assert validator is not None
         assert converter is not None
+    
+    def test_create_pipeline_is_frozen(self):
+        """Pipelines are immutable and report whether they can export."""
+        from dataclasses import FrozenInstanceError
+        
+        manager = PluginManager.get_instance()
+        manager.discover_plugins()
+        
+        pipeline = manager.get_plugin("dtdl").create_pipeline()
+        
+        assert pipeline.format_name == "dtdl"
+        assert pipeline.exporter is not None
+        assert pipeline.has_exporter() is (manager.get_plugin("dtdl").get_exporter() is not None)
+        with pytest.raises(FrozenInstanceError):
+            pipeline.exporter = None
+    
+    def test_pipeline_without_exporter_uses_null_exporter(self):
+        """A missing exporter is replaced by a no-op exporter."""
+        from formats.base import FormatPipeline
+        
+        pipeline = FormatPipeline(
+            format_name="test", parser=object(), validator=object(), converter=object(),
+            exporter=None,
+        )
+        
+        assert not pipeline.has_exporter()
+        assert pipeline.exporter.export([], []) is None
 
 
 class TestProtocols:
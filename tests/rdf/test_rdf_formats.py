@@ -76,6 +76,15 @@ class TestRDFFormatSupport:
             result = RDFGraphParser.normalize_format(alias)
             assert result == expected, f"Alias '{alias}' should normalize to '{expected}', got '{result}'"
 
+    def test_format_normalization_fast_path(self):
+        """Canonical names resolve through the alias table; others are cleaned."""
+        for fmt in RDFGraphParser.SUPPORTED_FORMATS:
+            assert RDFGraphParser.FORMAT_ALIASES[fmt] == fmt
+
+        assert RDFGraphParser.normalize_format(" TTL ") == "turtle"
+        assert RDFGraphParser.normalize_format("JSON-LD") == "json-ld"
+        assert RDFGraphParser.normalize_format("Custom") == "custom"
+
     def test_unsupported_format_raises_error(self):
         """Test that unsupported formats raise ValueError."""
         with pytest.raises(ValueError, match="Unsupported RDF serialization format"):
@@ -634,6 +643,19 @@ class TestDatasetFormats:
         # Should have multiple named graphs
         assert len(graphs) >= 2, "N-Quads file should contain multiple named graphs"
 
+    def test_dataset_context_count(self, samples_dir):
+        """Parsed datasets report one context per distinct named graph."""
+        sample_file = samples_dir / "sample_iot_ontology.nq"
+
+        if not sample_file.exists():
+            pytest.skip(f"Sample file not found: {sample_file}")
+
+        graph, _, _ = RDFGraphParser.parse_ttl_file(str(sample_file))
+
+        expected = len({ctx.identifier for ctx in graph.contexts()})
+        assert expected >= 2
+        assert RDFGraphParser._count_contexts(graph) == expected
+
     def test_trig_multiple_graphs(self, samples_dir):
         """Test that TriG correctly handles multiple named graphs."""
         sample_file = samples_dir / "sample_iot_ontology.trig"
@@ -649,6 +671,48 @@ class TestDatasetFormats:
         assert "{" in content and "}" in content, "TriG file should contain graph blocks"
 
 
+class TestParserMemoryManager:
+    """Test the psutil caching in the parser's MemoryManager."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        from src.formats.rdf import rdf_parser
+
+        if not rdf_parser.PSUTIL_AVAILABLE:
+            pytest.skip("psutil not installed")
+        monkeypatch.setattr(rdf_parser.MemoryManager, "_available_sample", None)
+        monkeypatch.setattr(rdf_parser.MemoryManager, "_process", None)
+        return rdf_parser.MemoryManager
+
+    def test_available_memory_reused_within_ttl(self, manager, monkeypatch):
+        """Back-to-back reads hit /proc once; expired readings are refreshed."""
+        import psutil
+
+        calls = []
+        real_virtual_memory = psutil.virtual_memory
+
+        def counting_virtual_memory():
+            calls.append(1)
+            return real_virtual_memory()
+
+        monkeypatch.setattr(psutil, "virtual_memory", counting_virtual_memory)
+
+        first = manager.get_available_memory_mb()
+        assert manager.get_available_memory_mb() == first
+        assert len(calls) == 1
+
+        monkeypatch.setattr(manager, "AVAILABLE_MEMORY_TTL_S", 0.0)
+        manager.get_available_memory_mb()
+        assert len(calls) == 2
+
+    def test_process_handle_reused(self, manager):
+        """The psutil.Process handle is created once per process."""
+        assert manager.get_memory_usage_mb() > 0
+        process = manager._process
+        manager.get_memory_usage_mb()
+        assert manager._process is process
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])